@@ -1,48 +1,509 @@
-from copy import copy, deepcopy
+import csv
+import json
 import random
-from math import sqrt
+import re
+import struct
+from math import log, sqrt
 import string
 import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-# TODO: Update the reader fuction to handle multiple .txt file formats of words
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the optional "numpy" engine
+    np = None
 
-logging.basicConfig(
-    filename="word_search.log",
-    format="%(asctime)s : %(levelname)s : %(message)s",
-    level=logging.DEBUG,
-)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+WORD_FORMATS = ("auto", "plain", "numbered", "csv", "jsonl")
+
+# leading "N." / "N)" numbering, which may also run several words together
+NUMBERING = re.compile(r"\s*\d+\s*[.)]\s*")
+
+
+def read_words(
+    source,
+    fmt: str = "auto",
+    field=0,
+    min_len: int = None,
+    max_len: int = None,
+    alphabet: str = None,
+    dedupe: bool = True,
+    header: bool = False,
+):
+    """Streams normalized, upper-cased words from a path or open file without loading
+    it whole. field picks the CSV column (index or header name) or the JSON key.
+    header skips a CSV file's first row, which a header name for field implies.
+    Lengths and the alphabet are checked on the word without spaces. Words with
+    letters outside the grid's latin-1 raise ValueError, unless the alphabet
+    already leaves them out."""
+    if fmt not in WORD_FORMATS:
+        raise ValueError(f"Unknown word format '{fmt}', expected one of {WORD_FORMATS}")
+
+    if fmt == "auto":
+        name = str(getattr(source, "name", source)).lower()
+        if name.endswith(".csv"):
+            fmt = "csv"
+        elif name.endswith((".jsonl", ".ndjson")):
+            fmt = "jsonl"
+
+    allowed = None if alphabet is None else set(alphabet.upper())
+    seen = set()
+
+    if hasattr(source, "read"):
+        lines = source
+    else:
+        lines = open(source, "r", newline="" if fmt == "csv" else None)
+
+    try:
+        for raw in _raw_words(lines, fmt, field, header):
+            word = " ".join(raw.split()).upper()
+            letters = word.replace(" ", "")
+            if not letters:
+                continue
+            if min_len is not None and len(letters) < min_len:
+                continue
+            if max_len is not None and len(letters) > max_len:
+                continue
+            if allowed is not None and not allowed.issuperset(letters):
+                continue
+            check_encodable(word)
+            if dedupe:
+                if word in seen:
+                    continue
+                seen.add(word)
+            yield word
+    finally:
+        if lines is not source:
+            lines.close()
+
+
+def _raw_words(lines, fmt: str, field, header: bool = False):
+    """Yields the un-normalized words of each line for a given format"""
+    if fmt == "csv":
+        rows = csv.reader(lines)
+        if isinstance(field, str):  # a named column means the first row is a header
+            field = next(rows, []).index(field)
+        elif header:
+            next(rows, None)
+        for row in rows:
+            if len(row) > field:
+                yield row[field]
+
+    elif fmt == "jsonl":
+        key = field if isinstance(field, str) else "word"
+        for line in lines:
+            if line.strip():
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    item = item.get(key)
+                if isinstance(item, str):  # like short CSV rows, skip the rest
+                    yield item
+
+    else:
+        for line in lines:
+            if fmt == "plain" or not NUMBERING.match(line):
+                yield line
+            else:
+                yield from NUMBERING.split(line)[1:]
 
 
 def read_from_txt(txt_file: str = "untitled.txt") -> list:
     """Opens a text file to get all words, called from outside the class instantiation"""
-    with open(txt_file, "r") as words:
-        lines = words.readlines()
-        return [
-            line.split(".")[1].strip().upper() for line in lines
-        ]  # removes leading numbering w/ following '.'
+    return list(read_words(txt_file, dedupe=False))
+
+
+ENGINES = ("python", "numpy")
+SOLVERS = ("greedy", "backtrack")
+SIZINGS = ("heuristic", "search")
+FILLS = ("random", "unique")
+
+# the original three orientations come first, their index is stored by to_bytes
+ORIENTATIONS = (
+    "vertical",
+    "horizontal",
+    "diagonal",
+    "vertical_reversed",
+    "horizontal_reversed",
+    "diagonal_reversed",
+    "anti_diagonal",
+    "anti_diagonal_reversed",
+)
+
+# (row step, col step) taken by each successive letter of a word
+STEPS = {
+    "vertical": (1, 0),
+    "horizontal": (0, 1),
+    "diagonal": (1, 1),
+    "vertical_reversed": (-1, 0),
+    "horizontal_reversed": (0, -1),
+    "diagonal_reversed": (-1, -1),
+    "anti_diagonal": (-1, 1),
+    "anti_diagonal_reversed": (1, -1),
+}
+
+# the orientation that reads a placed word back to front
+OPPOSITES = {
+    orientation: next(
+        other for other, step in STEPS.items() if step == (-row_step, -col_step)
+    )
+    for orientation, (row_step, col_step) in STEPS.items()
+}
+
+# orientations a puzzle may use; "classic" reads only down, right and down-right
+DIRECTION_SETS = {"classic": ORIENTATIONS[:3], "all": ORIENTATIONS}
+
+# every line a word can be read along, either way: rows, columns and both diagonals
+LINE_STEPS = ((0, 1), (1, 0), (1, 1), (-1, 1))
+
+ENCODING = "latin-1"  # one byte per grid cell
+BLANK = ord("_")
+
+# bumped whenever a seed stops producing the same puzzle, so caches can tell
+GENERATOR_VERSION = 2
+
+# random bytes map to letters by value % 26; the top 256 % 26 values are dropped
+# first so every letter stays equally likely
+LETTER_BYTES = bytes(ord("A") + value % 26 for value in range(256))
+BIASED_BYTES = bytes(range(256 - 256 % 26, 256))
+# 0x00 where a cell is blank, 0xFF where it holds a word letter
+KEEP_MASK = bytes(0x00 if value == BLANK else 0xFF for value in range(256))
+
+
+def check_encodable(word: str):
+    """Raises ValueError for a word with letters a one-byte grid cell can't hold"""
+    try:
+        word.encode(ENCODING)
+    except UnicodeEncodeError as error:
+        raise ValueError(
+            f"'{word}' has {word[error.start]!r}, grids only hold {ENCODING} letters"
+        ) from None
+
+
+class PlacementError(Exception):
+    """Raised when the words could not all be placed on the grid. steps counts the
+    words the greedy solver tried, or the placements the backtracking one made,
+    and elapsed the seconds since placement started."""
+
+    def __init__(
+        self,
+        word: str,
+        reason: str,
+        placed: int = 0,
+        total: int = 0,
+        steps: int = 0,
+        elapsed: float = 0.0,
+    ):
+        self.word = word
+        self.reason = reason
+        self.placed = placed
+        self.total = total
+        self.steps = steps
+        self.elapsed = elapsed
+        super().__init__(
+            f"Unable to place '{word}' ({reason}): {placed}/{total} words placed "
+            f"after {steps} steps in {elapsed:.3f}s"
+        )
+
+
+class Metrics:
+    """Collects the counters and per-phase timings CreateWordSearch reports to its
+    metrics hook. Any object with the same count and timing methods can be used."""
+
+    def __init__(self):
+        self.counters = {}  # name -> running total
+        self.timings = {}  # phase -> total seconds
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def timing(self, phase: str, seconds: float):
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+
+class Puzzle:
+    """Lightweight, read-only result of a generated word search"""
+
+    __slots__ = ("grid", "words", "placements")
+
+    def __init__(self, grid: tuple, words: tuple, placements: tuple):
+        self.grid = grid  # one string per row
+        self.words = words  # words as supplied, in list order
+        self.placements = placements  # (placed word, orientation, (row, col))
+
+    def __eq__(self, other):
+        if not isinstance(other, Puzzle):
+            return NotImplemented
+        return (self.grid, self.words, self.placements) == (
+            other.grid,
+            other.words,
+            other.placements,
+        )
+
+    def __repr__(self):
+        return f"Puzzle({len(self.grid)}x{len(self.grid)}, {len(self.words)} words)"
+
+    @property
+    def grid_dimension(self) -> int:
+        return len(self.grid)
+
+    def word_cells(self) -> set:
+        """(row, col) of every cell holding a letter of a placed word"""
+        cells = set()
+        for word, orientation, (row, col) in self.placements:
+            row_step, col_step = STEPS[orientation]
+            cells.update(
+                (row + row_step * idx, col + col_step * idx) for idx in range(len(word))
+            )
+        return cells
+
+    def ledger(self) -> list:
+        """Answer key from the recorded placements, no grid search needed. One
+        (word, (row, col), orientation, reversed) entry per placement, in order:
+        the word as supplied, the cell of its first letter and the orientation it
+        reads in. reversed marks words placed back to front."""
+        supplied = {}  # placed letters -> supplied words not yet matched
+        for word in self.words:
+            supplied.setdefault(word.replace(" ", ""), []).append(word)
+
+        entries = []
+        for placed, orientation, (row, col) in self.placements:
+            if supplied.get(placed):
+                entries.append((supplied[placed].pop(), (row, col), orientation, False))
+                continue
+
+            # read from the last letter back, the way the supplied word runs
+            row_step, col_step = STEPS[orientation]
+            last = len(placed) - 1
+            start = (row + row_step * last, col + col_step * last)
+            matches = supplied.get(placed[::-1])
+            word = matches.pop() if matches else placed[::-1]
+            entries.append((word, start, OPPOSITES[orientation], True))
+        return entries
+
+    def to_dict(self) -> dict:
+        """Plain JSON-ready form of the puzzle"""
+        return {
+            "grid": list(self.grid),
+            "words": list(self.words),
+            "placements": [
+                {"word": word, "orientation": orientation, "row": row, "col": col}
+                for word, orientation, (row, col) in self.placements
+            ],
+        }
+
+    def to_bytes(self) -> bytes:
+        """Packs the puzzle into a compact binary record, see from_bytes"""
+        parts = [
+            PUZZLE_HEADER.pack(
+                self.grid_dimension, len(self.words), len(self.placements)
+            ),
+            "".join(self.grid).encode(ENCODING),
+        ]
+        for word in self.words:
+            parts.append(_pack_text(word))
+        for word, orientation, (row, col) in self.placements:
+            parts.append(PLACEMENT.pack(ORIENTATIONS.index(orientation), row, col))
+            parts.append(_pack_text(word))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "Puzzle":
+        """Unpacks a record written by to_bytes"""
+        dimension, word_count, placement_count = PUZZLE_HEADER.unpack_from(data)
+        pos = PUZZLE_HEADER.size + dimension * dimension
+        cells = bytes(data[PUZZLE_HEADER.size : pos]).decode(ENCODING)
+        grid = tuple(
+            cells[start : start + dimension]
+            for start in range(0, len(cells), dimension)
+        )
+
+        words = []
+        for _ in range(word_count):
+            word, pos = _unpack_text(data, pos)
+            words.append(word)
+
+        placements = []
+        for _ in range(placement_count):
+            orientation, row, col = PLACEMENT.unpack_from(data, pos)
+            word, pos = _unpack_text(data, pos + PLACEMENT.size)
+            placements.append((word, ORIENTATIONS[orientation], (row, col)))
+
+        return cls(grid, tuple(words), tuple(placements))
+
+
+# binary puzzle records: header, grid cells, then length-prefixed UTF-8 strings
+PUZZLE_HEADER = struct.Struct("<HHH")  # dimension, word count, placement count
+PLACEMENT = struct.Struct("<BHH")  # orientation index, row, col
+TEXT_LENGTH = struct.Struct("<H")
+
+
+def _pack_text(text: str) -> bytes:
+    encoded = text.encode("utf-8")
+    return TEXT_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_text(data, pos: int) -> tuple:
+    (length,) = TEXT_LENGTH.unpack_from(data, pos)
+    pos += TEXT_LENGTH.size
+    return bytes(data[pos : pos + length]).decode("utf-8"), pos + length
+
+
+@lru_cache(maxsize=1024)
+def slot_table(dimension: int, length: int, orientation: str) -> tuple:
+    """Cached (rows, cols, offset, stride, windows) of a word length along an orientation"""
+    span = dimension - 1
+    ranges = {
+        1: range(0, span - length + 1),
+        0: range(0, span),
+        -1: range(length - 1, span),
+    }
+    row_step, col_step = STEPS[orientation]
+    rows, cols = ranges[row_step], ranges[col_step]
+
+    stride = row_step * dimension + col_step
+    offset = stride * (length - 1) if stride < 0 else 0
+
+    windows = tuple(
+        (
+            slice(rows.start + row_step * idx, rows.stop + row_step * idx),
+            slice(cols.start + col_step * idx, cols.stop + col_step * idx),
+        )
+        for idx in range(length)
+    )
+    return rows, cols, offset, abs(stride), windows
 
 
 class CreateWordSearch:
     """Class that generates a particular word search"""
 
-    def __init__(self, words: list, out_file: str = "intx_test.txt"):
-        self.words = words
-        logging.info(f"Word list has {len(self.words)} words.")
-        self.search_words = self.reverse_sort_words()
-        self.grid = self.create_grid()
+    def __init__(
+        self,
+        words: list,
+        out_file: str = None,
+        engine: str = "python",
+        solver: str = "greedy",
+        time_budget: float = None,
+        step_budget: int = None,
+        max_backtrack: int = 3,
+        seed: int = None,
+        grid_dimension: int = None,
+        metrics=None,
+        sizing: str = "heuristic",
+        rev_percent: int = 25,
+        fill: str = "random",
+        directions: str = "classic",
+        preset: list = None,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+        if engine == "numpy" and np is None:
+            raise ImportError("The 'numpy' engine requires numpy to be installed")
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver '{solver}', expected one of {SOLVERS}")
+        if sizing not in SIZINGS:
+            raise ValueError(f"Unknown sizing '{sizing}', expected one of {SIZINGS}")
+        if fill is not None and fill not in FILLS:
+            raise ValueError(f"Unknown fill '{fill}', expected one of {FILLS}")
+        if directions not in DIRECTION_SETS:
+            raise ValueError(
+                f"Unknown directions '{directions}', "
+                f"expected one of {tuple(DIRECTION_SETS)}"
+            )
+        if preset and grid_dimension is None:
+            raise ValueError("A preset layout needs an explicit grid_dimension")
+        self.fill = fill  # None leaves the blanks, for placement-only runs
+        self.directions = directions
+        self.orientations = DIRECTION_SETS[directions]
+        self.engine = engine
+        self.sizing = sizing
+        self.solver = solver
+        self.time_budget = time_budget  # seconds, None for no limit
+        self.step_budget = step_budget  # placement attempts, None for no limit
+        self.max_backtrack = max_backtrack  # placed words the solver may undo
+        # a seeded instance draws from its own generator instead of the global one
+        self.rng = random if seed is None else random.Random(seed)
+        self.metrics = metrics  # optional hook, see Metrics
+        self.words = list(words)  # a copy, add_word and remove_word edit it
+        for word in self.words:
+            check_encodable(word)
+        self.rev_percent = rev_percent
+        self.letter_cells = {}  # letter -> set of (row, col) already holding it
+        self.placements = []  # (placed word, orientation, (row, col)) in order
+        self._scan = None  # (orientation, word, cells, options) of the last numpy scan
+        logger.info(f"Word list has {len(self.words)} words.")
+        started = time.perf_counter()
+        self.search_words = self.reverse_sort_words(rev_percent)
+        started = self.report_phase("sort", started)
+        self._grid_view = None
+        self.grid_dimension = grid_dimension  # None to size from the word list
+        self.cells = self.create_grid()
+        started = self.report_phase("grid_sizing", started)
+        self.place_preset(preset or ())
         self.fill_words()
+        started = self.report_phase("placement", started)
         self.fill_grid()
-        self.write_grid(out_file)
-        self.write_words(out_file)
+        started = self.report_phase("fill", started)
+        if out_file is not None:
+            with open(out_file, "w") as write_file:
+                write_puzzle(self.to_puzzle(), write_file)
+            self.report_phase("write", started)
+
+    def report_phase(self, phase: str, started: float) -> float:
+        """Reports the time since started to the metrics hook, returns the time now"""
+        now = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.timing(phase, now - started)
+        return now
+
+    def report_count(self, name: str, value: int = 1):
+        """Adds to a counter on the metrics hook, if there is one"""
+        if self.metrics is not None:
+            self.metrics.count(name, value)
+
+    def to_puzzle(self) -> Puzzle:
+        """Snapshot of the generated grid, word list and placements"""
+        return Puzzle(
+            tuple(self.rows(self.cells)),
+            tuple(self.words),
+            tuple(self.placements),
+        )
+
+    def rows(self, cells: bytes) -> list:
+        """Splits a flat grid into one string per row"""
+        dim = self.grid_dimension
+        return [
+            cells[start : start + dim].decode(ENCODING)
+            for start in range(0, dim * dim, dim)
+        ]
+
+    @property
+    def grid(self) -> list:
+        """List-of-lists view of the grid, rebuilt only after the grid changes"""
+        if self._grid_view is None:
+            self._grid_view = [list(row) for row in self.rows(self.cells)]
+        return self._grid_view
+
+    @property
+    def before_fill(self) -> list:
+        """List-of-lists view of the grid as it was before the random fill"""
+        return [list(row) for row in self.rows(self.word_cells)]
 
     def reverse_sort_words(self, rev_percent: int = 25):
         """Reverses a percentage of the words and returns a list sorted from longest to shortest words to help with filling the sheet"""
-        rev_words = deepcopy(self.words)
-        for idx, word in enumerate(rev_words):
-            if random.randint(0, 100) <= rev_percent:
-                rev_words[idx] = word[::-1].replace(" ", "")
-            else:
-                rev_words[idx] = word.replace(" ", "")
+        draws = self.rng.choices(range(101), k=len(self.words))
+        rev_words = [
+            (
+                word[::-1].replace(" ", "")
+                if draw <= rev_percent
+                else word.replace(" ", "")
+            )
+            for word, draw in zip(self.words, draws)
+        ]
 
         rev_words.sort(
             key=len, reverse=True
@@ -50,15 +511,40 @@ class CreateWordSearch:
 
         return rev_words
 
-    def create_grid(self) -> list:
+    def create_grid(self) -> bytearray:
         """Builds an 'empty' grid based on characteristics of the word list supplied."""
+        if self.grid_dimension is None and self.sizing == "search":
+            self.grid_dimension = minimum_grid_dimension(
+                word_fingerprint(self.search_words),
+                self.engine,
+                self.directions,
+                self.time_budget,
+            )
+            logger.info(f"Smallest feasible dimension: {self.grid_dimension}")
+        elif self.grid_dimension is None:
+            self.grid_dimension = self.size_grid()
+        else:
+            logger.info(f"Using requested dimension: {self.grid_dimension}")
+
+        # one byte per cell, row after row, so (row, col) lives at row * dimension + col
+        cells = bytearray(b"_" * (self.grid_dimension * self.grid_dimension))
+
+        if self.engine == "numpy":  # a 2-D view sharing memory with the flat grid
+            self.np_grid = np.frombuffer(cells, dtype=np.uint8).reshape(
+                self.grid_dimension, self.grid_dimension
+            )
+
+        return cells
+
+    def size_grid(self) -> int:
+        """Picks a grid dimension from the length and number of words"""
         str_lengths = [len(word) for word in self.search_words]
         total_chars = sum(str_lengths)
-        logging.info(f"Total characters in word list: {total_chars}")
+        logger.info(f"Total characters in word list: {total_chars}")
 
         array_chars = total_chars / 0.70
         char_dim = int(sqrt(array_chars))
-        logging.info(
+        logger.info(
             f"Dimesion based on word characters at 70% of available spaces: {char_dim}"
         )
 
@@ -66,138 +552,513 @@ class CreateWordSearch:
         buffer = int(longest_word_len * 0.3)
 
         long_word_dim = longest_word_len + buffer
-        logging.info(f"Dimension based on longest word: {long_word_dim}")
+        logger.info(f"Dimension based on longest word: {long_word_dim}")
+
+        grid_dimension = char_dim if char_dim >= long_word_dim else long_word_dim
+        logger.info(f"Chosen maximum dimension: {grid_dimension}")
 
-        self.grid_dimension = char_dim if char_dim >= long_word_dim else long_word_dim
-        logging.info(f"Chosen maximum dimension: {self.grid_dimension}")
+        return grid_dimension
 
-        grid = []
-        for _ in range(self.grid_dimension):
-            grid.append(list("_" * self.grid_dimension))
-        return grid
+    def place_preset(self, placements):
+        """Lays down (placed word, orientation, (row, col)) placements made earlier,
+        such as those of another puzzle, before any of the words are placed"""
+        for word, orientation, start in placements:
+            if self.check_word(start, orientation, word) < 0:
+                raise ValueError(f"Preset placement of '{word}' at {start} clashes")
+            self.place_word(start, orientation, word)
 
     def fill_words(self):
         """Loops through words and adds them to the grid"""
-        for word in self.search_words:
+        if self.solver == "backtrack":
+            self.solve_words()
+            self.word_cells = bytes(self.cells)
+            return
 
-            # pick orientation of word (vertical, horizontal, diagonal)
-            orientation = random.choice(["vertical", "horizontal", "diagonal"])
+        started = time.perf_counter()
+        for placed, word in enumerate(self.search_words):
+
+            # pick orientation of word (vertical, horizontal, diagonal, ...)
+            orientation = self.rng.choice(self.orientations)
+
+            intx_options = self.intersecting_options(orientation, word)
+
+            if intx_options:  # there's at least one valid option
+                self.place_word(self.rng.choice(intx_options), orientation, word)
+                continue
 
             options = self.assess_options(orientation, word)
 
-            if options is None:
-                logging.warning(f"Unable to find valid placement for '{word}'")
-                raise Exception()
+            if not options:
+                logger.warning(f"Unable to find valid placement for '{word}'")
+                raise PlacementError(
+                    word,
+                    "no_options",
+                    placed,
+                    len(self.search_words),
+                    placed + 1,
+                    time.perf_counter() - started,
+                )
+
+            self.place_word(self.rng.choice(options), orientation, word)
+
+        self.word_cells = bytes(self.cells)
+
+    def solve_words(self):
+        """Places the words depth first, trying every orientation of a word before
+        undoing up to max_backtrack earlier placements, within the time/step budget"""
+        started = time.perf_counter()
+        total = len(self.search_words)
+        if not total:
+            return
+        candidates = [self.placement_candidates(self.search_words[0])]
+        placed_cells = []  # cells newly written by each placed word
+        frontier = 0  # furthest word index reached
+        steps = 0
+
+        while len(placed_cells) < total:
+            idx = len(placed_cells)
+            word = self.search_words[idx]
+            elapsed = time.perf_counter() - started
+
+            if self.step_budget is not None and steps >= self.step_budget:
+                logger.warning(f"Step budget exhausted placing '{word}'")
+                raise PlacementError(word, "step_budget", idx, total, steps, elapsed)
+            if self.time_budget is not None and elapsed >= self.time_budget:
+                logger.warning(f"Time budget exhausted placing '{word}'")
+                raise PlacementError(word, "time_budget", idx, total, steps, elapsed)
 
+            candidate = next(candidates[idx], None)
+            if candidate is None:
+                if idx == 0 or frontier - (idx - 1) > self.max_backtrack:
+                    logger.warning(f"Unable to find valid placement for '{word}'")
+                    raise PlacementError(word, "exhausted", idx, total, steps, elapsed)
+
+                logger.debug(f"Backtracking from '{word}'")
+                self.report_count("retries")
+                candidates.pop()
+                self.remove_cells(placed_cells.pop())
+                self.placements.pop()
+                continue
+
+            steps += 1
+            orientation, option = candidate
+            placed_cells.append(self.place_word(option, orientation, word))
+            frontier = max(frontier, idx + 1)
+            if idx + 1 < total:
+                candidates.append(self.placement_candidates(self.search_words[idx + 1]))
+
+        logger.info(f"Placed {total} words in {steps} steps")
+
+    def placement_candidates(self, word: str):
+        """Yields (orientation, option) placements for a word, starting with a random
+        orientation and moving on to the others once it is exhausted"""
+        orientation = self.rng.choice(self.orientations)
+        yield from self.orientation_candidates(orientation, word)
+
+        others = [other for other in self.orientations if other != orientation]
+        self.rng.shuffle(others)
+        for orientation in others:
+            yield from self.orientation_candidates(orientation, word)
+
+    def orientation_candidates(self, orientation: str, word: str):
+        """Yields placements in random order, intersecting placements first"""
+        tried = set()
+        intx_options = self.intersecting_options(orientation, word)
+        for options in (intx_options, None):
+            if options is None:  # only scan the grid once the intersections run out
+                options = [
+                    option
+                    for option in self.assess_options(orientation, word)
+                    if option not in tried
+                ]
+            while options:
+                option = self.rng.choice(options)
+                options.remove(option)
+                tried.add(option)
+                yield orientation, option
+
+    def start_ranges(self, orientation: str, word_len: int) -> tuple:
+        """Returns the (rows, cols) ranges a word's start cell can take"""
+        return slot_table(self.grid_dimension, word_len, orientation)[:2]
+
+    def kernel(self, orientation: str, word: str) -> tuple:
+        """Returns (offset, stride, letters) so a word starting at flat index pos
+        covers cells[pos + offset :: stride] with a positive stride. Words read
+        towards the top or left are matched from their last cell with the letters
+        reversed, so every direction goes through the same slice."""
+        _, _, offset, stride, _ = slot_table(
+            self.grid_dimension, len(word), orientation
+        )
+        letters = word.encode(ENCODING)
+        return offset, stride, letters[::-1] if offset else letters
+
+    def intersecting_options(self, orientation: str, word: str) -> list:
+        """Lists placements crossing an already placed letter using the letter index,
+        in the same (row, col, intx) form and order as assess_options"""
+        rows, cols = self.start_ranges(orientation, len(word))
+        if self.engine == "numpy":  # one batched scan beats the index on big grids
+            options = self.assess_options(orientation, word)
+            # kept for assess_options, should none of these work out
+            self._scan = (orientation, word, bytes(self.cells), options)
             intx_options = [option for option in options if option[2] > 0]
+            self.report_count("intersections", len(intx_options))
+            return intx_options
 
-            if intx_options:  # there's at least one valid option
-                self.place_word(random.choice(intx_options), orientation, word)
-            else:
-                self.place_word(random.choice(options), orientation, word)
+        row_step, col_step = STEPS[orientation]
+        offset, stride, letters = self.kernel(orientation, word)
+
+        starts = set()
+        for idx, letter in enumerate(word):
+            for row, col in self.letter_cells.get(letter, ()):
+                start = (row - row_step * idx, col - col_step * idx)
+                if start[0] in rows and start[1] in cols:
+                    starts.add(start)
+
+        intx_options = []
+        for start in sorted(starts):
+            intx = self.check_stride(
+                start[0] * self.grid_dimension + start[1] + offset, stride, letters
+            )
+            if intx > 0:
+                intx_options.append((start[0], start[1], intx))
 
-        self.before_fill = deepcopy(self.grid)
+        self.report_count("candidates", len(starts))
+        self.report_count("intersections", len(intx_options))
+        return intx_options
 
     def assess_options(self, orientation: str, word: str) -> list:
         """Assesses all possible placements of a word and returns a list with viable
         orientations & number of intersections"""
 
+        if self.engine == "numpy":
+            scan = self._scan
+            if scan and scan[:2] == (orientation, word) and scan[2] == self.cells:
+                return list(scan[3])  # the scan intersecting_options just made
+            rows, cols = self.start_ranges(orientation, len(word))
+            self.report_count("candidates", len(rows) * len(cols))
+            return self.assess_options_numpy(orientation, word)
+
+        rows, cols = self.start_ranges(orientation, len(word))
+        self.report_count("candidates", len(rows) * len(cols))
+
         valid_starts = []  # will store in tuple (row, col, intx)
 
-        if orientation == "horizontal":
-            max_row = self.grid_dimension - 1
-            max_col = self.grid_dimension - len(word)
+        offset, stride, letters = self.kernel(orientation, word)
+        dim = self.grid_dimension
+        check_stride = self.check_stride
 
-            for row in range(0, max_row):
-                for col in range(0, max_col):
-                    intx = self.check_horizontal((row, col), word)
-                    if intx >= 0:
-                        valid_starts.append((row, col, intx))
+        for row in rows:
+            row_offset = row * dim + offset
+            for col in cols:
+                intx = check_stride(row_offset + col, stride, letters)
+                if intx >= 0:
+                    valid_starts.append((row, col, intx))
 
-        elif orientation == "vertical":
-            max_row = self.grid_dimension - len(word)
-            max_col = self.grid_dimension - 1
+        return valid_starts
 
-            for row in range(0, max_row):
-                for col in range(0, max_col):
-                    intx = self.check_vertical((row, col), word)
-                    if intx >= 0:
-                        valid_starts.append((row, col, intx))
+    def assess_options_numpy(self, orientation: str, word: str) -> list:
+        """Scores every start for a word in one batched comparison against the uint8
+        grid, returns the same (row, col, intx) tuples as the pure-Python path"""
+        rows, cols, _, _, slots = slot_table(
+            self.grid_dimension, len(word), orientation
+        )
+        if not rows or not cols:
+            return []
 
-        else:
-            max_row = self.grid_dimension - len(word)
-            max_col = self.grid_dimension - len(word)
+        # windows[idx, row, col] is the cell for letter idx of a start at (row, col)
+        windows = np.stack([self.np_grid[slot] for slot in slots])
+        letters = np.frombuffer(word.encode(ENCODING), dtype=np.uint8)[:, None, None]
 
-            for row in range(0, max_row):
-                for col in range(0, max_col):
-                    intx = self.check_diagonal((row, col), word)
-                    if intx >= 0:
-                        valid_starts.append((row, col, intx))
+        matches = windows == letters
+        valid = (matches | (windows == BLANK)).all(axis=0)
+        intx = matches.sum(axis=0)
 
-        return valid_starts
+        valid_rows, valid_cols = np.nonzero(valid)
+        return list(
+            zip(
+                (valid_rows + rows.start).tolist(),
+                (valid_cols + cols.start).tolist(),
+                intx[valid_rows, valid_cols].tolist(),
+            )
+        )
 
-    def check_vertical(self, start: tuple, word: str) -> int:
-        """Attempts to place word vertically and returns number of intersections"""
+    def check_stride(self, pos: int, stride: int, letters: bytes) -> int:
+        """Attempts to place encoded letters from flat index pos onwards and returns
+        the number of intersections, or -1 if a cell holds a different letter"""
         intx = 0
 
-        for idx, letter in enumerate(word):
-            if (
-                self.grid[start[0] + idx][start[1]] != "_"
-                and self.grid[start[0] + idx][start[1]] != letter
-            ):
-                return -1
-            elif self.grid[start[0] + idx][start[1]] == letter:
+        for cell, letter in zip(
+            self.cells[pos : pos + stride * len(letters) : stride], letters
+        ):
+            if cell != BLANK:
+                if cell != letter:
+                    return -1
                 intx += 1
 
         return intx
 
-    def check_horizontal(self, start: tuple, word: str) -> int:
-        """Attempts to place word horizontally and returns number of intersections"""
-        intx = 0
+    def check_word(self, start: tuple, orientation: str, word: str) -> int:
+        """Attempts to place word from start in any orientation and returns the
+        number of intersections, or -1 if it clashes with a placed letter"""
+        offset, stride, letters = self.kernel(orientation, word)
+        return self.check_stride(
+            start[0] * self.grid_dimension + start[1] + offset, stride, letters
+        )
+
+    def place_word(self, start: tuple, orientation: str, word: str):
+        """Places word on the grid from a start point and given orientation, returns
+        the cells that were empty before"""
+        offset, stride, letters = self.kernel(orientation, word)
+        pos = start[0] * self.grid_dimension + start[1] + offset
+        self.cells[pos : pos + stride * len(word) : stride] = letters
+        self._grid_view = None
 
+        row_step, col_step = STEPS[orientation]
+        new_cells = []
         for idx, letter in enumerate(word):
-            if (
-                self.grid[start[0]][start[1] + idx] != "_"
-                and self.grid[start[0]][start[1] + idx] != letter
-            ):
-                return -1
-            elif self.grid[start[0]][start[1] + idx] == letter:
-                intx += 1
+            cell = (start[0] + row_step * idx, start[1] + col_step * idx)
+            letter_cells = self.letter_cells.setdefault(letter, set())
+            if cell not in letter_cells:
+                new_cells.append(cell)
+                letter_cells.add(cell)
 
-        return intx
+        self.placements.append((word, orientation, (start[0], start[1])))
+        return new_cells
 
-    def check_diagonal(self, start: tuple, word: str) -> int:
-        """Attempts to place word diagonally and returns number of intersections"""
-        intx = 0
+    def remove_cells(self, cells: list):
+        """Clears cells written by a placement, keeping letters other words share"""
+        for row, col in cells:
+            pos = row * self.grid_dimension + col
+            self.letter_cells[chr(self.cells[pos])].discard((row, col))
+            self.cells[pos] = BLANK
+        self._grid_view = None
 
-        for idx, letter in enumerate(word):
-            if (
-                self.grid[start[0] + idx][start[1] + idx] != "_"
-                and self.grid[start[0] + idx][start[1] + idx] != letter
-            ):
-                return -1
-            elif self.grid[start[0] + idx][start[1] + idx] == letter:
-                intx += 1
+    def use_cells(self, cells: bytearray):
+        """Makes cells the grid that placement reads and writes"""
+        self.cells = cells
+        if self.engine == "numpy":
+            self.np_grid = np.frombuffer(cells, dtype=np.uint8).reshape(
+                self.grid_dimension, self.grid_dimension
+            )
+        self._grid_view = None
 
-        return intx
+    def add_word(self, word: str) -> tuple:
+        """Places one more word on the finished puzzle, leaving the other words where
+        they are. Only the new word's cells change, plus with the unique fill the
+        fill letters in line with them and those of any copy the fill already
+        spelled, which are redrawn. Returns the placement."""
+        check_encodable(word)
+        started = time.perf_counter()
+        if self.rng.choices(range(101))[0] <= self.rev_percent:
+            placed = word[::-1].replace(" ", "")
+        else:
+            placed = word.replace(" ", "")
 
-    def place_word(self, start: tuple, orientation: str, word: str):
-        """Places word on the grid from a start point and given orientation"""
-        for idx, letter in enumerate(word):
-            if orientation == "vertical":
-                self.grid[start[0] + idx][start[1]] = letter
-            elif orientation == "horizontal":
-                self.grid[start[0]][start[1] + idx] = letter
+        filled = self.cells
+        self.use_cells(bytearray(self.word_cells))
+        candidate = next(self.placement_candidates(placed), None)
+        if candidate is None:
+            self.use_cells(filled)
+            logger.warning(f"Unable to find valid placement for '{placed}'")
+            raise PlacementError(
+                placed, "no_options", 0, 1, 1, time.perf_counter() - started
+            )
+        orientation, option = candidate
+        new_cells = self.place_word(option, orientation, placed)
+        self.word_cells = bytes(self.cells)
+        self.use_cells(filled)
+
+        dim = self.grid_dimension
+        for row, col in new_cells:
+            filled[row * dim + col] = self.word_cells[row * dim + col]
+        if self.fill == "unique":  # redraw fill letters the new word could extend
+            reach = max(len(other) for other, _, _ in self.placements) - 1
+            for row, col in new_cells:
+                for row_step, col_step in LINE_STEPS:
+                    for distance in range(-reach, reach + 1):
+                        r, c = row + row_step * distance, col + col_step * distance
+                        if 0 <= r < dim and 0 <= c < dim:
+                            if self.word_cells[r * dim + c] == BLANK:
+                                filled[r * dim + c] = BLANK
+            # fill letters elsewhere may already spell the new word
+            keep = {row * dim + col for row, col in new_cells}
+            for copy in self.find_copies(placed):
+                if set(copy) != keep:
+                    for pos in copy:
+                        if self.word_cells[pos] == BLANK:
+                            filled[pos] = BLANK
+            self.fill_grid()
+
+        self.words.append(word)
+        self.search_words.append(placed)
+        self.report_phase("edit", started)
+        return self.placements[-1]
+
+    def find_copies(self, word: str) -> list:
+        """Lists the flat indices of every copy of word, either way round, along the
+        rows, columns and both diagonals of the current grid"""
+        dim = self.grid_dimension
+        patterns = {word.encode(ENCODING), word[::-1].encode(ENCODING)}
+        copies = []
+        for row_step, col_step in LINE_STEPS:
+            # columns start on the top row, the rest on the first column, and the
+            # diagonals also on the edge row they run away from
+            if not col_step:
+                starts = [(0, col) for col in range(dim)]
             else:
-                self.grid[start[0] + idx][start[1] + idx] = letter
+                starts = [(row, 0) for row in range(dim)]
+                if row_step:
+                    edge_row = 0 if row_step == 1 else dim - 1
+                    starts += [(edge_row, col) for col in range(1, dim)]
+            for row, col in starts:
+                line = []
+                while 0 <= row < dim and 0 <= col < dim:
+                    line.append(row * dim + col)
+                    row, col = row + row_step, col + col_step
+                text = bytes(self.cells[pos] for pos in line)
+                for pattern in patterns:
+                    found = text.find(pattern)
+                    while found >= 0:
+                        copies.append(line[found : found + len(pattern)])
+                        found = text.find(pattern, found + 1)
+        return copies
+
+    def remove_word(self, word: str) -> tuple:
+        """Takes a word off the finished puzzle, clearing only the cells no other word
+        uses and refilling just those. Returns the removed placement."""
+        started = time.perf_counter()
+        letters = word.replace(" ", "")
+        for idx in range(len(self.placements) - 1, -1, -1):
+            if self.placements[idx][0] in (letters, letters[::-1]):
+                break
+        else:
+            raise ValueError(f"'{word}' is not placed on this puzzle")
+        placed, orientation, start = self.placements.pop(idx)
+
+        shared = set()
+        for other, other_orientation, (row, col) in self.placements:
+            row_step, col_step = STEPS[other_orientation]
+            shared.update(
+                (row + row_step * pos, col + col_step * pos)
+                for pos in range(len(other))
+            )
+        row_step, col_step = STEPS[orientation]
+        vacated = [
+            cell
+            for cell in (
+                (start[0] + row_step * pos, start[1] + col_step * pos)
+                for pos in range(len(placed))
+            )
+            if cell not in shared
+        ]
+
+        filled = self.cells
+        self.use_cells(bytearray(self.word_cells))
+        self.remove_cells(vacated)
+        self.word_cells = bytes(self.cells)
+        self.use_cells(filled)
+        for row, col in vacated:
+            filled[row * self.grid_dimension + col] = BLANK
+        self.fill_grid()
+
+        supplied = [other.replace(" ", "") for other in self.words]
+        if letters in supplied:
+            del self.words[supplied.index(letters)]
+        if placed in self.search_words:  # preset words were never searched for
+            self.search_words.remove(placed)
+        self.report_phase("edit", started)
+        return placed, orientation, start
 
     def fill_grid(self):
         """Fill the empty spots on the grid with random letters"""
+        if self.fill is None:
+            return
+        if self.fill == "unique":
+            return self.fill_grid_unique()
+        self.fill_grid_random()
+
+    def fill_grid_random(self):
+        """Fills the empty spots with uniformly random letters"""
+        # draw a letter for every cell at once, then keep the word letters over it
+        size = len(self.cells)
+        letters = int.from_bytes(self.random_letters(size), "little")
+        keep = int.from_bytes(self.cells.translate(KEEP_MASK), "little")
+        cells = int.from_bytes(self.cells, "little")
+        self.cells[:] = ((cells & keep) | (letters & ~keep)).to_bytes(size, "little")
+        self._grid_view = None
+
+    def random_letters(self, count: int) -> bytes:
+        """Draws count uniformly random upper-case letters in a few bulk calls"""
+        drawn = b""
+        while len(drawn) < count:
+            needed = count - len(drawn)
+            drawn += self.rng.randbytes(needed + needed // 8 + 8).translate(
+                None, BIASED_BYTES
+            )
+        return drawn[:count].translate(LETTER_BYTES)
+
+    def fill_grid_unique(self):
+        """Fills the empty spots with random letters that never complete another copy
+        of a search word. Cells are filled in order, so every line segment through a
+        cell is checked when its last empty cell is filled."""
         fill_opts = list(string.ascii_uppercase)
-        for idx, row in enumerate(self.grid):
-            for i, col in enumerate(row):
-                if self.grid[idx][i] == "_":
-                    self.grid[idx][i] = random.choice(fill_opts)
+
+        # each placed word, either way round, with one letter masked -> the letters
+        placed_words = {word for word, _, _ in self.placements}
+        if not placed_words:
+            return self.fill_grid_random()
+        masked = {}
+        for word in placed_words:
+            for pattern in (word, word[::-1]):
+                for idx, letter in enumerate(pattern):
+                    key = pattern[:idx] + "?" + pattern[idx + 1 :]
+                    masked.setdefault(key, set()).add(letter)
+        lengths = sorted({len(word) for word in placed_words})
+        reach = lengths[-1] - 1  # furthest a word through a cell extends past it
+
+        dim = self.grid_dimension
+        cells = self.cells
+        for pos, cell in enumerate(cells):
+            if cell != BLANK:
+                continue
+            row, col = divmod(pos, dim)
+
+            forbidden = set()
+            for row_step, col_step in LINE_STEPS:
+                # filled cells either side of this one, up to the longest word
+                sides = []
+                for direction in (-1, 1):
+                    side = []
+                    r, c = row + direction * row_step, col + direction * col_step
+                    while (
+                        len(side) < reach
+                        and 0 <= r < dim
+                        and 0 <= c < dim
+                        and cells[r * dim + c] != BLANK
+                    ):
+                        side.append(chr(cells[r * dim + c]))
+                        r, c = r + direction * row_step, c + direction * col_step
+                    sides.append(side)
+
+                line = "".join(reversed(sides[0])) + "?" + "".join(sides[1])
+                centre = len(sides[0])
+                for length in lengths:
+                    if length > len(line):
+                        break
+                    for start in range(
+                        max(0, centre - length + 1), min(centre, len(line) - length) + 1
+                    ):
+                        letters = masked.get(line[start : start + length])
+                        if letters:
+                            forbidden |= letters
+
+            allowed = [letter for letter in fill_opts if letter not in forbidden]
+            if not allowed:
+                logger.warning(f"No letter avoids a duplicate word at {(row, col)}")
+                allowed = fill_opts
+            cells[pos] = ord(self.rng.choice(allowed))
+
+        self._grid_view = None
 
     def write_grid(self, filename: str):
         """Write the grid to a text file"""
@@ -213,7 +1074,407 @@ class CreateWordSearch:
             for word in self.words:
                 write_file.write(word + "\n")
 
+    def write_answer_key(self, filename: str):
+        """Write the answer key and solution grid to a text file"""
+        puzzle = self.to_puzzle()
+        with open(filename, "w") as write_file:
+            write_file.write(format_answer_key(puzzle))
+            write_file.write("\n")
+            write_file.write(format_solution(puzzle))
+
+
+def generate(words: list, **options) -> Puzzle:
+    """Generates a puzzle in memory, options are passed on to CreateWordSearch"""
+    return CreateWordSearch(words, out_file=None, **options).to_puzzle()
+
+
+def word_fingerprint(words) -> tuple:
+    """Order and direction independent key for a word list, as placed on the grid"""
+    return tuple(sorted(min(word, word[::-1]) for word in words))
+
+
+def grid_is_feasible(
+    words: tuple,
+    grid_dimension: int,
+    engine: str = "python",
+    probes: int = 3,
+    directions: str = "classic",
+) -> bool:
+    """Cheap feasibility check: every one of a few seeded greedy placements fits.
+    A probe stops at the first word it cannot place and never fills the grid. The
+    engines place identically, so probes use numpy whenever it is installed."""
+    if np is not None:
+        engine = "numpy"
+    for probe in range(probes):
+        try:
+            CreateWordSearch(
+                list(words),
+                seed=probe,
+                engine=engine,
+                grid_dimension=grid_dimension,
+                directions=directions,
+                fill=None,
+            )
+        except PlacementError:
+            return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def minimum_grid_dimension(
+    words: tuple,
+    engine: str = "python",
+    directions: str = "classic",
+    time_budget: float = None,
+) -> int:
+    """Searches for the smallest feasible grid dimension for a word fingerprint.
+    Grows from the lower bound in doubling steps, then bisects the last step,
+    settling for the smallest feasible dimension found once time_budget seconds
+    have passed. Results are cached, so repeat runs of a word list skip the search."""
+    started = time.perf_counter()
+    total_chars = sum(len(word) for word in words)
+    # every letter needs a cell, and the starts exclude the last row and column
+    low = max(int(sqrt(total_chars)), len(max(words, key=len)) + 1)
+
+    high, step = low, 1
+    while not grid_is_feasible(words, high, engine, directions=directions):
+        low = high + 1
+        high += step
+        step *= 2
+
+    while low < high:
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            logger.info(f"Grid search out of time, settling for {high}")
+            break
+        middle = (low + high) // 2
+        if grid_is_feasible(words, middle, engine, directions=directions):
+            high = middle
+        else:
+            low = middle + 1
+
+    return high
+
+
+def format_puzzle(puzzle: Puzzle) -> str:
+    """Text form of a puzzle: spaced grid rows, a blank line, then the word list"""
+    lines = [" ".join(row) for row in puzzle.grid]
+    lines.append("")
+    lines.extend(puzzle.words)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def format_answer_key(puzzle: Puzzle) -> str:
+    """Text answer key: each word with the row and column, counted from 1, of its
+    first letter and the orientation it reads in"""
+    entries = puzzle.ledger()
+    width = max((len(word) for word, _, _, _ in entries), default=0)
+    lines = [
+        f"{word:<{width}}  row {row + 1}, col {col + 1}, {orientation}"
+        for word, (row, col), orientation, _ in entries
+    ]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def format_solution(puzzle: Puzzle, blank: str = ".") -> str:
+    """Solution grid showing only the letters of placed words, in the same spaced
+    layout as format_puzzle, written straight from the placements"""
+    dim = puzzle.grid_dimension
+    rows = [[blank] * dim for _ in range(dim)]
+    for word, orientation, (row, col) in puzzle.placements:
+        row_step, col_step = STEPS[orientation]
+        for idx, letter in enumerate(word):
+            rows[row + row_step * idx][col + col_step * idx] = letter
+    lines = [" ".join(row) for row in rows]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def answer_key_to_dict(puzzle: Puzzle) -> dict:
+    """JSON-ready answer key with the cells of every word, in reading order"""
+    answers = []
+    for word, (row, col), orientation, is_reversed in puzzle.ledger():
+        row_step, col_step = STEPS[orientation]
+        answers.append(
+            {
+                "word": word,
+                "row": row,
+                "col": col,
+                "orientation": orientation,
+                "reversed": is_reversed,
+                "cells": [
+                    [row + row_step * idx, col + col_step * idx]
+                    for idx in range(len(word.replace(" ", "")))
+                ],
+            }
+        )
+    return {"grid_dimension": puzzle.grid_dimension, "answers": answers}
+
+
+def write_puzzle(puzzle: Puzzle, write_file):
+    """Writes a puzzle to an open file-like object with a single write call"""
+    write_file.write(format_puzzle(puzzle))
+
+
+def write_puzzles(puzzles, write_file, separator: str = "\n"):
+    """Writes many puzzles to one shared handle, separated by a blank line"""
+    for idx, puzzle in enumerate(puzzles):
+        if idx:
+            write_file.write(separator)
+        write_puzzle(puzzle, write_file)
+
+
+def puzzle_seeds(base_seed: int, count: int) -> list:
+    """Derives the per-puzzle seeds of a batch from its base seed"""
+    seed_rng = random.Random(base_seed)
+    return [seed_rng.getrandbits(64) for _ in range(count)]
+
+
+def _generate_seeded(args: tuple) -> Puzzle:
+    """Process pool worker, builds one puzzle without writing it to disk"""
+    words, seed, options = args
+    return generate(list(words), seed=seed, **options)
+
+
+def generate_batch(
+    words: list, count: int, base_seed: int = 0, workers: int = None, **options
+) -> list:
+    """Generates count puzzles from one word list across a process pool. Results come
+    back in order and depend only on base_seed, not on the number of workers"""
+    jobs = [(words, seed, options) for seed in puzzle_seeds(base_seed, count)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_seeded, jobs, chunksize=max(1, count // 64)))
+
+
+# how much each layout statistic, all between 0 and 1, counts towards its score
+LAYOUT_WEIGHTS = {"intersections": 1.0, "direction_mix": 0.5, "fill_ratio": 1.0}
+
+
+def layout_stats(puzzle: Puzzle) -> dict:
+    """Quality measures of a layout: the share of placed letters that sit on
+    another word's letter, how evenly the words read in every orientation, and the
+    share of the grid covered by words"""
+    total = sum(len(word) for word, _, _ in puzzle.placements)
+    covered = len(puzzle.word_cells())
+
+    readings = {}
+    for _, _, orientation, _ in puzzle.ledger():
+        readings[orientation] = readings.get(orientation, 0) + 1
+    count = sum(readings.values())
+    entropy = -sum(n / count * log(n / count) for n in readings.values())
+
+    return {
+        "intersections": (total - covered) / total if total else 0.0,
+        "direction_mix": entropy / log(len(ORIENTATIONS)),
+        "fill_ratio": covered / puzzle.grid_dimension**2,
+    }
+
+
+def score_layout(puzzle: Puzzle, weights: dict = None) -> float:
+    """Weighted sum of layout_stats, higher is a denser, harder puzzle"""
+    weights = LAYOUT_WEIGHTS if weights is None else weights
+    stats = layout_stats(puzzle)
+    return sum(weight * stats[name] for name, weight in weights.items())
+
+
+def _generate_candidate(args: tuple) -> tuple:
+    """Pool worker, returns (idx, puzzle) or, when its words don't fit, (idx, the
+    (word, reason) of the PlacementError). With a deadline, the candidate gets
+    what is left of the budget and, unless told otherwise, the backtracking
+    solver that keeps to it."""
+    idx, (words, seed, options), deadline = args
+    if deadline is not None:
+        remaining = max(0.0, deadline - time.time())
+        if options.get("time_budget") is not None:
+            remaining = min(remaining, options["time_budget"])
+        options = {"solver": "backtrack", **options, "time_budget": remaining}
+    try:
+        return idx, _generate_seeded((words, seed, options))
+    except PlacementError as error:
+        return idx, (error.word, error.reason)
+
+
+def optimize_layout(
+    words: list,
+    candidates: int = 8,
+    time_budget: float = None,
+    base_seed: int = 0,
+    workers: int = None,
+    weights: dict = None,
+    metrics=None,
+    **options,
+) -> Puzzle:
+    """Generates candidate layouts across a process pool and returns the one that
+    scores best. Once time_budget seconds have passed, the best layout finished so
+    far wins and the candidates still running are stopped; PlacementError with the
+    reason "time_budget" is raised if none finished. Without a budget, or when
+    every candidate finishes in time, the result depends only on base_seed. Other
+    options go to CreateWordSearch."""
+    started = time.perf_counter()
+    # wall clock, as the workers compare against it in their own processes
+    deadline = None if time_budget is None else time.time() + time_budget
+    jobs = [
+        (idx, (words, seed, options), deadline)
+        for idx, seed in enumerate(puzzle_seeds(base_seed, candidates))
+    ]
+    best, best_score, best_idx, failure = None, None, None, None
+    finished = failed = 0
+
+    # a Pool rather than an executor, as only a Pool can stop running workers
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.imap_unordered(_generate_candidate, jobs)
+        for _ in jobs:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.time())
+            try:
+                idx, puzzle = results.next(timeout)
+            except multiprocessing.TimeoutError:
+                break
+
+            finished += 1
+            if not isinstance(puzzle, Puzzle):
+                failed += 1
+                failure = puzzle
+                continue
+            score = score_layout(puzzle, weights)
+            # ties go to the lower seed index so timing never picks the winner
+            if best is None or (score, -idx) > (best_score, -best_idx):
+                best, best_score, best_idx = puzzle, score, idx
+    finally:
+        pool.terminate()
+
+    elapsed = time.perf_counter() - started
+    if metrics is not None:
+        metrics.count("layouts", finished - failed)
+        metrics.count("layouts_failed", failed)
+        metrics.timing("optimize", elapsed)
+    if best is None:
+        if finished < candidates:  # out of time before any layout was done
+            word = failure[0] if failure else words[0]
+            raise PlacementError(word, "time_budget", 0, len(words), 0, elapsed)
+        word, reason = failure  # every candidate failed, report the last failure
+        raise PlacementError(word, reason, 0, len(words), 0, elapsed)
+    logger.info(f"Best of {finished} layouts scores {best_score:.3f} ({failed} failed)")
+    return best
+
+
+def _place_tile(args: tuple) -> tuple:
+    """Process pool worker, places as many of a tile's words as fit on a tile-sized
+    grid. Returns its placements and the words left over for the stitching pass."""
+    words, seed, tile_size, options = args
+    words = list(words)
+    leftovers = []
+    while words:
+        try:
+            tile = CreateWordSearch(
+                words, seed=seed, grid_dimension=tile_size, **options
+            )
+            return tuple(tile.placements), leftovers
+        except PlacementError as error:  # give the word to the stitching pass
+            word = next(
+                word
+                for word in words
+                if word.replace(" ", "") in (error.word, error.word[::-1])
+            )
+            words.remove(word)
+            leftovers.append(word)
+    return (), leftovers
+
+
+def generate_poster(
+    words: list,
+    grid_dimension: int = None,
+    tile_size: int = 50,
+    stitch_percent: int = 5,
+    seed: int = 0,
+    workers: int = None,
+    metrics=None,
+    **options,
+) -> Puzzle:
+    """Generates a poster-size puzzle from independent tiles stitched in one pass"""
+    started = time.perf_counter()
+    total_chars = sum(len(word.replace(" ", "")) for word in words)
+    if grid_dimension is None:
+        grid_dimension = int(sqrt(total_chars / 0.70))
+    tiles_across = max(1, -(-grid_dimension // tile_size))
+    grid_dimension = tiles_across * tile_size
+
+    rng = random.Random(seed)
+    order = list(words)
+    rng.shuffle(order)
+    stitch_count = len(order) * stitch_percent // 100
+    stitch_words, tile_words = order[:stitch_count], order[stitch_count:]
+
+    # longest words first onto the tile with the fewest letters so far
+    tile_lists = [[] for _ in range(tiles_across * tiles_across)]
+    loads = [0] * len(tile_lists)
+    for word in sorted(
+        tile_words, key=lambda word: len(word.replace(" ", "")), reverse=True
+    ):
+        letters = len(word.replace(" ", ""))
+        if letters > tile_size - 1:  # too long to fit inside a tile
+            stitch_words.append(word)
+            continue
+        idx = loads.index(min(loads))
+        tile_lists[idx].append(word)
+        loads[idx] += letters
+
+    tile_options = {**options, "fill": "random"}  # tile fills are thrown away
+    jobs = [
+        (tile_list, tile_seed, tile_size, tile_options)
+        for tile_list, tile_seed in zip(tile_lists, puzzle_seeds(seed, len(tile_lists)))
+    ]
+    preset = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for idx, (placements, leftovers) in enumerate(executor.map(_place_tile, jobs)):
+            top, left = divmod(idx, tiles_across)
+            top, left = top * tile_size, left * tile_size
+            preset.extend(
+                (word, orientation, (row + top, col + left))
+                for word, orientation, (row, col) in placements
+            )
+            stitch_words.extend(leftovers)
+    tiled = time.perf_counter()
+    if metrics is not None:
+        metrics.timing("tiles", tiled - started)
+
+    options.setdefault("solver", "backtrack")  # tries every orientation of a word
+    stitched = CreateWordSearch(
+        stitch_words,
+        seed=rng.getrandbits(64),
+        grid_dimension=grid_dimension,
+        metrics=metrics,
+        preset=preset,
+        **options,
+    )
+    puzzle = Puzzle(
+        tuple(stitched.rows(stitched.cells)),
+        tuple(words),
+        tuple(stitched.placements),
+    )
+
+    word_cells = len(stitched.word_cells) - stitched.word_cells.count(BLANK)
+    elapsed = time.perf_counter() - started
+    if metrics is not None:
+        metrics.count("stitched", len(stitch_words))
+        metrics.count("word_cells", word_cells)
+        metrics.timing("poster", elapsed)
+    logger.info(
+        f"Poster {grid_dimension}x{grid_dimension}: {len(words)} words, "
+        f"{len(stitch_words)} stitched, {word_cells / len(stitched.cells):.0%} "
+        f"of cells hold word letters, {elapsed:.2f}s"
+    )
+    return puzzle
+
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        filename="word_search.log",
+        format="%(asctime)s : %(levelname)s : %(message)s",
+        level=logging.DEBUG,
+    )
     word_list = read_from_txt("US_States_Cities.txt")
     test = CreateWordSearch(word_list, "States_cities_puzzle.txt")
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# the modules live at the repository root rather than in an installed package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bigus_word_search import read_from_txt  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def states() -> list:
+    """The US states and cities word list shipped with the repository"""
+    return read_from_txt(os.path.join(ROOT, "US_States_Cities.txt"))
+
+
+@pytest.fixture(scope="session")
+def occurrences():
+    """Counts how often each of a puzzle's words appears on a grid"""
+    from word_search_verify import WordFinder
+
+    def count(words, grid) -> dict:
+        finder = WordFinder(words)
+        counts = dict.fromkeys(finder.words, 0)
+        for word, _, _ in finder.find(grid):
+            counts[word] += 1
+        return counts
+
+    return count
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from bigus_word_search import Puzzle, generate
+from word_search_archive import (
+    ARCHIVE_HEADER,
+    ArchiveError,
+    ArchiveWriter,
+    PuzzleArchive,
+    write_archive,
+)
+
+
+@pytest.fixture(scope="module")
+def puzzles(states) -> list:
+    """A few puzzles with reversed words in every direction, and accented words"""
+    words = states[:30] + ["KRAKÓW", "MÜNCHEN"]
+    return [
+        generate(words, seed=seed, solver="backtrack", directions="all")
+        for seed in range(5)
+    ]
+
+
+def test_puzzle_bytes_round_trip(puzzles):
+    for puzzle in puzzles:
+        data = puzzle.to_bytes()
+        assert Puzzle.from_bytes(data) == puzzle
+        assert Puzzle.from_bytes(memoryview(data)) == puzzle
+
+
+def test_archive_round_trip(tmp_path, puzzles):
+    path = os.path.join(tmp_path, "puzzles.bwsa")
+    assert write_archive(path, puzzles) == len(puzzles)
+
+    with PuzzleArchive(path) as archive:
+        assert len(archive) == len(puzzles)
+        assert list(archive) == puzzles
+        for idx, puzzle in enumerate(puzzles):
+            assert archive[idx] == puzzle
+            assert archive[idx - len(puzzles)] == puzzle
+            assert archive.grid(idx) == puzzle.grid
+        with pytest.raises(IndexError):
+            archive[len(puzzles)]
+        with pytest.raises(IndexError):
+            archive[-len(puzzles) - 1]
+
+
+def test_empty_archive(tmp_path):
+    path = os.path.join(tmp_path, "empty.bwsa")
+    with ArchiveWriter(path):
+        pass
+    with PuzzleArchive(path) as archive:
+        assert len(archive) == 0
+        assert list(archive) == []
+
+
+def test_truncated_archives_are_rejected(tmp_path, puzzles):
+    path = os.path.join(tmp_path, "puzzles.bwsa")
+    write_archive(path, puzzles)
+    with open(path, "rb") as archive_file:
+        data = archive_file.read()
+
+    truncated = os.path.join(tmp_path, "truncated.bwsa")
+    for size in (0, ARCHIVE_HEADER.size - 1, len(data) - 1):
+        with open(truncated, "wb") as archive_file:
+            archive_file.write(data[:size])
+        with pytest.raises(ArchiveError):
+            PuzzleArchive(truncated)
+
+    # a writer that was never closed leaves the header unpatched
+    unclosed = ArchiveWriter(os.path.join(tmp_path, "unclosed.bwsa"))
+    unclosed.add(puzzles[0])
+    unclosed._file.flush()
+    with pytest.raises(ArchiveError):
+        PuzzleArchive(unclosed.path)
+    unclosed.close()
+
+
+def test_bad_magic_is_rejected(tmp_path):
+    path = os.path.join(tmp_path, "other.bin")
+    with open(path, "wb") as other_file:
+        other_file.write(b"NOPE" + bytes(ARCHIVE_HEADER.size))
+    with pytest.raises(ArchiveError):
+        PuzzleArchive(path)
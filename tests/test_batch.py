@@ -0,0 +1,19 @@
+from bigus_word_search import generate, generate_batch, puzzle_seeds
+
+
+def test_batch_does_not_depend_on_workers(states):
+    """A batch is the same puzzles in the same order however many workers run it"""
+    words = states[:40]
+    options = dict(solver="backtrack", fill="unique")
+    single = generate_batch(words, 12, base_seed=7, workers=1, **options)
+    pooled = generate_batch(words, 12, base_seed=7, workers=3, **options)
+    assert single == pooled
+    assert len({puzzle.to_bytes() for puzzle in single}) == 12
+
+
+def test_batch_matches_seeded_generate(states):
+    """Puzzle i of a batch is the one generate builds from the i-th batch seed"""
+    words = states[:40]
+    batch = generate_batch(words, 4, base_seed=2, workers=2, solver="backtrack")
+    seeds = puzzle_seeds(2, 4)
+    assert batch == [generate(words, seed=seed, solver="backtrack") for seed in seeds]
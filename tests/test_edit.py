@@ -0,0 +1,18 @@
+from bigus_word_search import CreateWordSearch, PlacementError
+
+
+def test_add_word_keeps_unique_fill(states, occurrences):
+    """The unique fill must not spell an added word anywhere it was not placed"""
+    for seed in range(30):
+        puzzle = CreateWordSearch(
+            states[:40], seed=seed, fill="unique", solver="backtrack"
+        )
+        for word in ("ZAP", "ART", "TEN", "ONE", "SEA"):
+            try:
+                puzzle.add_word(word)
+            except PlacementError:
+                pass
+
+        placed = occurrences(puzzle.words, puzzle.before_fill)
+        filled = occurrences(puzzle.words, puzzle.grid)
+        assert filled == placed, f"seed {seed}"
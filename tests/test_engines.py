@@ -0,0 +1,30 @@
+import pytest
+
+from bigus_word_search import DIRECTION_SETS, SOLVERS, PlacementError, generate
+
+pytest.importorskip("numpy")
+
+
+def outcome(words: list, seed: int, **options):
+    """The puzzle generated, or the word and reason it failed on"""
+    try:
+        return generate(words, seed=seed, **options)
+    except PlacementError as error:
+        return error.word, error.reason
+
+
+@pytest.mark.parametrize("directions", DIRECTION_SETS)
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_engines_match_for_a_seed(states, directions, solver):
+    """The numpy engine must build exactly the python engine's puzzle"""
+    for seed in range(4):
+        for grid_dimension in (None, 60):
+            options = dict(
+                seed=seed,
+                solver=solver,
+                directions=directions,
+                grid_dimension=grid_dimension,
+            )
+            python = outcome(states, engine="python", **options)
+            numpy = outcome(states, engine="numpy", **options)
+            assert python == numpy, options
@@ -0,0 +1,30 @@
+import pytest
+
+from bigus_word_search import CreateWordSearch
+
+
+@pytest.mark.parametrize("directions", ("classic", "all"))
+def test_unique_fill_adds_no_occurrences(states, occurrences, directions):
+    """Every copy of a word in a uniquely filled grid is already in the word layer"""
+    for seed in range(20):
+        puzzle = CreateWordSearch(
+            states[:60],
+            seed=seed,
+            fill="unique",
+            solver="backtrack",
+            directions=directions,
+        )
+        placed = occurrences(puzzle.words, puzzle.before_fill)
+        filled = occurrences(puzzle.words, puzzle.grid)
+        assert filled == placed, f"seed {seed}"
+
+
+def test_unique_fill_with_short_words(occurrences):
+    """Short words are the easiest for random letters to spell by accident"""
+    words = ["CAT", "DOG", "EEL", "ANT", "BEE", "OWL", "EMU", "YAK", "ELK", "APE"]
+    for seed in range(20):
+        puzzle = CreateWordSearch(
+            words, seed=seed, grid_dimension=12, fill="unique", solver="backtrack"
+        )
+        placed = occurrences(puzzle.words, puzzle.before_fill)
+        assert occurrences(puzzle.words, puzzle.grid) == placed, f"seed {seed}"
@@ -1,5 +1,4 @@
-# import word_search_creator.py via the execfile function
-exec(open("./word_search_creator.py").read())
+from word_search_creator import createWordSearch, stringifyWordSearch
 
 # request name of word search
 wordSearchName = input("\nName of word search: ")
@@ -54,7 +53,7 @@ print(("=" * paddingLength) + " " + wordSearchName + " " + ("=" * paddingLength)
 print("")
 
 # regenerate word list to fit initial user-inputted letter-cases
-wordList = read_from_txt(wordListFile)
+wordList = read_from_txt()
 
 # list of accepted letters for words
 acceptedLetters = list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
@@ -0,0 +1,150 @@
+"""Packed binary archive of many puzzles with random access through mmap.
+
+Layout, little-endian throughout:
+
+    header   magic, format version, puzzle count, offset of the index
+    records  one Puzzle.to_bytes record per puzzle: grid, words and placements
+    index    one 64-bit record offset per puzzle
+
+The index goes last so puzzles can be streamed in without knowing how many there
+will be; the header is patched when the writer closes. Readers map the file and
+decode only the record asked for.
+"""
+
+import mmap
+import os
+import struct
+
+from bigus_word_search import ENCODING, PUZZLE_HEADER, Puzzle
+
+MAGIC = b"BWSA"
+FORMAT_VERSION = 1
+ARCHIVE_HEADER = struct.Struct("<4sHxxQQ")  # magic, version, count, index offset
+OFFSET = struct.Struct("<Q")
+
+
+class ArchiveError(Exception):
+    """Raised when a file is not a complete puzzle archive"""
+
+
+class ArchiveWriter:
+    """Streams puzzles into a new archive file, use as a context manager"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offsets = []
+        self._file = open(path, "wb")
+        self._file.write(ARCHIVE_HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0))
+
+    def add(self, puzzle: Puzzle) -> int:
+        """Appends a puzzle and returns its index in the archive"""
+        self.offsets.append(self._file.tell())
+        self._file.write(puzzle.to_bytes())
+        return len(self.offsets) - 1
+
+    def close(self):
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(b"".join(OFFSET.pack(offset) for offset in self.offsets))
+        self._file.seek(0)
+        self._file.write(
+            ARCHIVE_HEADER.pack(MAGIC, FORMAT_VERSION, len(self.offsets), index_offset)
+        )
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_archive(path: str, puzzles) -> int:
+    """Writes an iterable of puzzles to a new archive, returns how many were written"""
+    with ArchiveWriter(path) as writer:
+        for puzzle in puzzles:
+            writer.add(puzzle)
+        return len(writer.offsets)
+
+
+class PuzzleArchive:
+    """Read-only, memory-mapped view of an archive. Indexing decodes one puzzle;
+    the pages of the others are never touched. Views from record and grid_cells
+    must be released before the archive is closed."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as archive_file:
+            if os.fstat(archive_file.fileno()).st_size < ARCHIVE_HEADER.size:
+                raise ArchiveError(f"'{path}' is too short to be a puzzle archive")
+            self._map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, version, self.count, self.index_offset = ARCHIVE_HEADER.unpack_from(
+            self._map
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ArchiveError(f"'{path}' is not a version {FORMAT_VERSION} archive")
+        if (
+            self.index_offset < ARCHIVE_HEADER.size
+            or self.index_offset + self.count * OFFSET.size > len(self._map)
+        ):
+            self.close()
+            raise ArchiveError(f"'{path}' is truncated, was its writer closed?")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, idx: int) -> memoryview:
+        """Zero-copy view of the packed record of puzzle idx"""
+        if not -self.count <= idx < self.count:
+            raise IndexError(f"Puzzle {idx} out of range for {self.count} puzzles")
+        idx %= self.count
+        (start,) = OFFSET.unpack_from(self._map, self.index_offset + idx * OFFSET.size)
+        if idx + 1 < self.count:
+            (end,) = OFFSET.unpack_from(
+                self._map, self.index_offset + (idx + 1) * OFFSET.size
+            )
+        else:
+            end = self.index_offset
+        return self._view[start:end]
+
+    def grid_cells(self, idx: int) -> tuple:
+        """Returns (dimension, zero-copy view of the grid's row-major cells) for
+        puzzle idx, one latin-1 letter per byte, without decoding the record"""
+        record = self.record(idx)
+        dimension = PUZZLE_HEADER.unpack_from(record)[0]
+        return (
+            dimension,
+            record[PUZZLE_HEADER.size : PUZZLE_HEADER.size + dimension * dimension],
+        )
+
+    def grid(self, idx: int) -> tuple:
+        """Puzzle idx's grid as one string per row, skipping words and placements"""
+        dimension, cells = self.grid_cells(idx)
+        cells = bytes(cells).decode(ENCODING)
+        return tuple(
+            cells[start : start + dimension]
+            for start in range(0, len(cells), dimension)
+        )
+
+    def __getitem__(self, idx: int) -> Puzzle:
+        return Puzzle.from_bytes(self.record(idx))
+
+    def __iter__(self):
+        for idx in range(self.count):
+            yield self[idx]
+
+    def close(self):
+        if self._map.closed:
+            return
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
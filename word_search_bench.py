@@ -0,0 +1,213 @@
+"""Benchmarks the word search generators over word counts, lengths and densities.
+
+Writes JSON that can be saved per commit and compared with --compare, e.g.
+
+    python word_search_bench.py --output before.json
+    python word_search_bench.py --compare before.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+
+import bigus_word_search
+import word_search_creator
+
+DEFAULT_COUNTS = (10, 50, 150)
+DEFAULT_LENGTHS = (5, 8, 12)
+DEFAULT_DENSITIES = (0.3, 0.5)  # share of grid cells the words would fill
+
+
+def make_words(count: int, length: int, seed: int) -> list:
+    """Builds a reproducible list of random upper-case words"""
+    rng = random.Random(f"{seed}:{count}:{length}")
+    return [
+        "".join(rng.choice(string.ascii_uppercase) for _ in range(length))
+        for _ in range(count)
+    ]
+
+
+def grid_for_density(words: list, density: float) -> int:
+    """Smallest grid dimension the words fill no more than density of"""
+    letters = sum(map(len, words))
+    return max(math.ceil(math.sqrt(letters / density)), len(max(words, key=len)) + 1)
+
+
+def run_bigus(words: list, seed: int, dimension: int, engine: str) -> int:
+    """Generates one puzzle with bigus_word_search, returns the grid dimension"""
+    puzzle = bigus_word_search.generate(
+        list(words), seed=seed, engine=engine, grid_dimension=dimension
+    )
+    return puzzle.grid_dimension
+
+
+def run_creator(words: list, seed: int, dimension: int) -> int:
+    """Generates one puzzle with word_search_creator, returns the grid dimension.
+    It sizes its own grid, growing it when words run out of room, so dimension
+    is ignored"""
+    random.seed(seed)
+    return len(word_search_creator.createWordSearch(list(words)))
+
+
+def engines() -> dict:
+    """Engine name -> callable(words, seed, dimension) returning the grid dimension"""
+    runners = {
+        "bigus-python": lambda *args: run_bigus(*args, "python"),
+        "creator": run_creator,
+    }
+    if bigus_word_search.np is not None:
+        runners["bigus-numpy"] = lambda *args: run_bigus(*args, "numpy")
+    return runners
+
+
+def bench_case(runner, words: list, seed: int, dimension: int, repeat: int) -> dict:
+    """Times repeat runs of one case, then measures peak memory in a traced run"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        grid_dimension = runner(words, seed, dimension)
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    runner(words, seed, dimension)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "grid_dimension": grid_dimension,
+        "density": round(sum(map(len, words)) / grid_dimension**2, 4),
+        "wall_s": best,
+        "wall_median_s": statistics.median(times),
+        "peak_kib": round(peak / 1024, 1),
+        "placements_per_s": round(len(words) / best, 1) if best else None,
+    }
+
+
+def run_matrix(
+    counts=DEFAULT_COUNTS,
+    lengths=DEFAULT_LENGTHS,
+    densities=DEFAULT_DENSITIES,
+    seed: int = 0,
+    repeat: int = 3,
+    selected: list = None,
+) -> dict:
+    """Runs every engine over every (count, length, density) case, returns the report"""
+    cases = []
+    for name, runner in engines().items():
+        if selected and name not in selected:
+            continue
+        for count in counts:
+            for length in lengths:
+                words = make_words(count, length, seed)
+                # the creator sizes its own grid, so it only runs once per word list
+                for density in densities if name != "creator" else (None,):
+                    case = {
+                        "engine": name,
+                        "words": count,
+                        "length": length,
+                        "target_density": density,
+                        "seed": seed,
+                    }
+                    cases.append(case)
+
+                    dimension = density and grid_for_density(words, density)
+
+                    try:
+                        case.update(bench_case(runner, words, seed, dimension, repeat))
+                    except bigus_word_search.PlacementError as error:
+                        case["failed"] = error.reason
+                    print(_describe(case), file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "numpy": getattr(bigus_word_search.np, "__version__", None),
+        "repeat": repeat,
+        "cases": cases,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    """Lists cases whose wall time grew by more than threshold over the baseline"""
+    before = {_key(case): case for case in baseline["cases"] if "wall_s" in case}
+    regressions = []
+    for case in report["cases"]:
+        old = before.get(_key(case))
+        if old is None or "wall_s" not in case:
+            continue
+        ratio = case["wall_s"] / old["wall_s"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {**case, "baseline_wall_s": old["wall_s"], "ratio": ratio}
+            )
+    return regressions
+
+
+def _key(case: dict) -> tuple:
+    return (
+        case["engine"],
+        case["words"],
+        case["length"],
+        case["target_density"],
+        case["seed"],
+    )
+
+
+def _describe(case: dict) -> str:
+    label = f"{case['engine']:>13} {case['words']:>4} words x {case['length']:>2}"
+    if case["target_density"] is not None:
+        label += f" @ {case['target_density']:.0%}"
+    if "wall_s" not in case:
+        return f"{label}: {case['failed']}"
+    return (
+        f"{label}: {case['wall_s'] * 1000:8.1f} ms  {case['peak_kib']:8.1f} KiB  "
+        f"{case['placements_per_s']:9.1f} words/s  ({case['grid_dimension']}x"
+        f"{case['grid_dimension']}, {case['density']:.0%} full)"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS)
+    parser.add_argument("--lengths", type=int, nargs="+", default=DEFAULT_LENGTHS)
+    parser.add_argument("--densities", type=float, nargs="+", default=DEFAULT_DENSITIES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engine", action="append", help="only run these engines")
+    parser.add_argument("--output", help="write the JSON report here, not stdout")
+    parser.add_argument("--compare", help="baseline JSON report to check against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_matrix(
+        args.counts, args.lengths, args.densities, args.seed, args.repeat, args.engine
+    )
+
+    if args.output:
+        with open(args.output, "w") as out_file:
+            json.dump(report, out_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.threshold)
+        for case in regressions:
+            print(f"REGRESSION {_describe(case)} x{case['ratio']:.2f}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
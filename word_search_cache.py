@@ -0,0 +1,142 @@
+"""On-disk LRU cache of generated puzzles, shared safely between processes.
+
+Puzzles are keyed by a hash of the normalized word list, the seed and the
+generation options, and stored as compact Puzzle.to_bytes records in SQLite.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from bigus_word_search import GENERATOR_VERSION, Puzzle, generate
+
+# options that change how a puzzle is generated but not which puzzle comes out
+IGNORED_OPTIONS = ("engine", "metrics", "out_file")
+
+
+def normalize_words(words) -> list:
+    """Upper-cases words and collapses runs of whitespace, keeping their order"""
+    return [" ".join(word.split()).upper() for word in words]
+
+
+def cache_key(words: list, seed: int, options: dict) -> str:
+    """Content address of a puzzle: the normalized words, seed and options. An
+    unseeded puzzle has none, as every run gives a different one."""
+    if seed is None:
+        raise ValueError("Unseeded puzzles cannot be cached, pass a seed")
+    options = {
+        name: value for name, value in options.items() if name not in IGNORED_OPTIONS
+    }
+    options.setdefault("rev_percent", 25)
+    payload = json.dumps(
+        {
+            "version": GENERATOR_VERSION,
+            "words": normalize_words(words),
+            "seed": seed,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PuzzleCache:
+    """Size-bounded LRU cache of puzzles in an SQLite file. SQLite's locking makes
+    it safe to share one file between processes; each process opens its own
+    connection on first use."""
+
+    def __init__(self, path: str = "puzzle_cache.sqlite", max_bytes: int = 64 << 20):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None
+            )
+            self._pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS puzzles ("
+                "key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS puzzles_last_used ON puzzles (last_used)"
+            )
+        return self._connection
+
+    def get(self, key: str) -> Puzzle:
+        """Returns the cached puzzle for key, or None, marking it recently used"""
+        row = self.connection.execute(
+            "SELECT data FROM puzzles WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.connection.execute(
+            "UPDATE puzzles SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        return Puzzle.from_bytes(row[0])
+
+    def put(self, key: str, puzzle: Puzzle):
+        """Stores a puzzle, evicting least recently used ones past max_bytes"""
+        data = puzzle.to_bytes()
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO puzzles VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection: sqlite3.Connection):
+        (total,) = connection.execute("SELECT SUM(size) FROM puzzles").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        stale = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM puzzles ORDER BY last_used"
+        ):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM puzzles WHERE key = ?", stale)
+
+    def generate(self, words: list, seed: int, **options) -> Puzzle:
+        """Returns the cached puzzle for these words, seed and options, generating
+        and storing it on a miss. Words are normalized before generation so the
+        result matches its key. Unseeded calls bypass the cache."""
+        if seed is None:
+            return generate(normalize_words(words), **options)
+        key = cache_key(words, seed, options)
+        puzzle = self.get(key)
+        if puzzle is None:
+            puzzle = generate(normalize_words(words), seed=seed, **options)
+            self.put(key, puzzle)
+        return puzzle
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM puzzles").fetchone()[0]
+
+    def clear(self):
+        self.connection.execute("DELETE FROM puzzles")
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
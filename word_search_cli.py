@@ -0,0 +1,200 @@
+"""Generates a word search for every word-list file in a directory or glob.
+
+    python word_search_cli.py lists/ "more/*.csv" --output-dir puzzles --workers 4
+
+Files are read with bigus_word_search.read_words, generated in parallel worker
+processes and written to the output directory as each one finishes, named after
+their stem, or their path relative to the other inputs where stems clash.
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from bigus_word_search import (
+    DIRECTION_SETS,
+    ENGINES,
+    FILLS,
+    SIZINGS,
+    SOLVERS,
+    PlacementError,
+    answer_key_to_dict,
+    format_answer_key,
+    format_puzzle,
+    format_solution,
+    generate,
+    read_words,
+)
+
+WORD_LIST_SUFFIXES = (".txt", ".csv", ".jsonl", ".ndjson")
+
+
+def find_word_lists(inputs: list) -> list:
+    """Expands directories and glob patterns into a sorted list of word-list files"""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            for name in os.listdir(item):
+                if name.lower().endswith(WORD_LIST_SUFFIXES):
+                    paths.add(os.path.join(item, name))
+        else:
+            paths.update(path for path in glob.glob(item) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def output_names(paths: list) -> dict:
+    """Maps each input path to a unique output name without a suffix. The file's
+    stem is enough unless another input shares it; those keep their directories
+    relative to the inputs' common one, then their suffix, until they differ."""
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+
+    def qualified(path: str, suffix: bool) -> str:
+        stem, ext = os.path.splitext(os.path.relpath(os.path.abspath(path), base))
+        stem = stem.replace(os.sep, "__")
+        return f"{stem}_{ext[1:]}" if suffix and ext else stem
+
+    names = {path: os.path.splitext(os.path.basename(path))[0] for path in paths}
+    for suffix in (False, True):
+        counts = Counter(names.values())
+        for path, name in names.items():
+            if counts[name] > 1:
+                names[path] = qualified(path, suffix)
+
+    counts = Counter(names.values())
+    clashing = sorted(path for path, name in names.items() if counts[name] > 1)
+    if clashing:
+        raise ValueError(f"Inputs {clashing} would overwrite each other's output")
+    return names
+
+
+def file_seed(base_seed: int, name: str) -> int:
+    """Seed for one output name, stable however many other files are in the batch"""
+    return random.Random(f"{base_seed}:{name}").getrandbits(64)
+
+
+def generate_file(
+    path: str,
+    name: str,
+    output_dir: str,
+    fmt: str,
+    seed: int,
+    options: dict,
+    answer_key: bool = False,
+    read_options: dict = None,
+) -> tuple:
+    """Worker: reads one word list, generates its puzzle and writes it out under
+    name, with its answer key if asked. Returns (input path, output path or None, grid
+    dimension or error)."""
+    words = list(read_words(path, **(read_options or {})))
+    if not words:
+        return path, None, "no words found"
+    try:
+        puzzle = generate(words, seed=seed, **options)
+    except PlacementError as error:
+        return path, None, str(error)
+
+    out_path = os.path.join(output_dir, f"{name}.{fmt}")
+    with open(out_path, "w") as out_file:
+        if fmt == "json":
+            result = {"seed": seed, **puzzle.to_dict()}
+            if answer_key:
+                result["answer_key"] = answer_key_to_dict(puzzle)["answers"]
+            json.dump(result, out_file)
+        else:
+            out_file.write(format_puzzle(puzzle))
+
+    if answer_key and fmt == "txt":
+        with open(os.path.join(output_dir, f"{name}.key.txt"), "w") as key_file:
+            key_file.write(format_answer_key(puzzle))
+            key_file.write("\n")
+            key_file.write(format_solution(puzzle))
+    return path, out_path, puzzle.grid_dimension
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="word-list files, dirs or globs")
+    parser.add_argument("-o", "--output-dir", default="puzzles")
+    parser.add_argument("-w", "--workers", type=int, help="defaults to CPU count")
+    parser.add_argument("--format", choices=("txt", "json"), default="txt")
+    parser.add_argument(
+        "--answer-key", action="store_true", help="also write each answer key"
+    )
+    parser.add_argument(
+        "--field", default="0", help="CSV column (index or header name) or JSON key"
+    )
+    parser.add_argument(
+        "--header", action="store_true", help="skip the first row of CSV files"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="base seed of the batch")
+    parser.add_argument("--engine", choices=ENGINES, default="python")
+    parser.add_argument("--solver", choices=SOLVERS, default="backtrack")
+    parser.add_argument("--sizing", choices=SIZINGS, default="heuristic")
+    parser.add_argument("--fill", choices=FILLS, default="random")
+    parser.add_argument("--directions", choices=DIRECTION_SETS, default="classic")
+    parser.add_argument(
+        "--time-budget", type=float, default=10.0, help="seconds per puzzle"
+    )
+    args = parser.parse_args(argv)
+
+    paths = find_word_lists(args.inputs)
+    if not paths:
+        print("No word-list files found", file=sys.stderr)
+        return 1
+    try:
+        names = output_names(paths)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    options = {
+        "engine": args.engine,
+        "solver": args.solver,
+        "sizing": args.sizing,
+        "fill": args.fill,
+        "directions": args.directions,
+        "time_budget": args.time_budget,
+    }
+    read_options = {
+        "field": int(args.field) if args.field.isdigit() else args.field,
+        "header": args.header,
+    }
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        jobs = {
+            executor.submit(
+                generate_file,
+                path,
+                names[path],
+                args.output_dir,
+                args.format,
+                file_seed(args.seed, names[path]),
+                options,
+                args.answer_key,
+                read_options,
+            ): path
+            for path in paths
+        }
+        for job in as_completed(jobs):
+            try:
+                path, out_path, result = job.result()
+            except Exception as error:  # e.g. a malformed file, keep going
+                path, out_path, result = jobs[job], None, repr(error)
+
+            if out_path is None:
+                failures += 1
+                print(f"FAILED {path}: {result}", file=sys.stderr)
+            else:
+                print(f"{path} -> {out_path} ({result}x{result})")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
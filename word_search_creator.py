@@ -1,7 +1,6 @@
-from copy import copy, deepcopy
 import random
 
-def createWordSearch(words):
+def createWordSearch(words, growGrid = True):
 	# there is a 25% chance that the word will be written reversed in the word search
 	# --> makes word search harder
 	for wordIndex in range(len(words)):
@@ -25,43 +24,21 @@ def createWordSearch(words):
 		# choose randomly between possible placement types (horizontal, vertical, and diagonal)
 		placementType = random.choice(["horizontal", "vertical", "diagonal"])
 
-		# placement location variable ( [x, y] )
-		placementLocation = [0, 0]
+		# list every placement location that fits the word, once per word
+		placementLocations = findPlacementLocations(grid, word, placementType)
 
-		# placement status (when placed, placement status is True and while loop ends)
-		placementStatus = False
+		# no room left for this orientation --> grow the grid by one row and column, or give up
+		while(len(placementLocations) == 0):
+			if(growGrid == False):
+				raise ValueError("no room to place '" + word + "' " + placementType + " in a " + str(gridSideLength) + "x" + str(gridSideLength) + " grid")
+			gridSideLength += 1
+			for row in grid:
+				row.append("")
+			grid.append([""] * gridSideLength)
+			placementLocations = findPlacementLocations(grid, word, placementType)
 
-		while(placementStatus == False):
-			# create grid copy to be edited in testing
-			#gridCopy = deepcopy(grid)
-
-			# create random coordinates for placement location
-			placementLocation = [random.randrange(gridSideLength), random.randrange(gridSideLength)]
-			if(placementType == "horizontal" or placementType == "diagonal"):
-				if(gridSideLength - len(word) == 0):
-					placementLocation[0] = 0
-				else:
-					placementLocation[0] = random.randrange(gridSideLength - len(word))
-			if(placementType == "vertical" or placementType == "diagonal"):
-				if(gridSideLength - len(word) == 0):
-					placementLocation[1] = 0
-				else:
-					placementLocation[1] = random.randrange(gridSideLength - len(word))
-			
-			# set placement status to True --> to be changed back to False if there is overlap in placement location
-			placementStatus = True
-
-			# loop through word and letter placement locations to check if placement location doesn't overlap with other words
-			for letterIndex in range(len(word)):
-				letter = word[letterIndex]
-				letterLocation = [placementLocation[0], placementLocation[1]]
-				if(placementType == "horizontal" or placementType == "diagonal"):
-					letterLocation[0] += letterIndex
-				if(placementType == "vertical" or placementType == "diagonal"):
-					letterLocation[1] += letterIndex
-				
-				if(grid[letterLocation[0]][letterLocation[1]] != "" and grid[letterLocation[0]][letterLocation[1]] != letter):
-					placementStatus = False
+		# pick one of the fitting placement locations ( [x, y] )
+		placementLocation = random.choice(placementLocations)
 
 		for letterIndex in range(len(word)):
 			letter = word[letterIndex]
@@ -73,16 +50,48 @@ def createWordSearch(words):
 			
 			grid[letterLocation[0]][letterLocation[1]] = letter
 
-	# fill the rest of grid with random letters
-	for rowIndex in range(len(grid)):
-		row = deepcopy(grid[rowIndex])
+	# fill the rest of grid with random letters, drawn all at once for the empty cells
+	emptyCount = sum(row.count("") for row in grid)
+	fillLetters = iter(random.choices("abcdefghijklmnopqrstuvwxyz", k=emptyCount))
+	for row in grid:
 		for itemIndex in range(len(row)):
 			if(row[itemIndex] == ""):
-				row[itemIndex] = random.choice(list("abcdefghijklmnopqrstuvwxyz"))
-		grid[rowIndex] = deepcopy(row)
+				row[itemIndex] = next(fillLetters)
 
 	return grid
 
+# list the [x, y] locations where a word fits for one placement type
+def findPlacementLocations(grid, word, placementType):
+	gridSideLength = len(grid)
+
+	# the coordinate the word runs along must leave room for the whole word
+	xRange = range(gridSideLength)
+	yRange = range(gridSideLength)
+	if(placementType == "horizontal" or placementType == "diagonal"):
+		xRange = range(max(gridSideLength - len(word), 1))
+	if(placementType == "vertical" or placementType == "diagonal"):
+		yRange = range(max(gridSideLength - len(word), 1))
+
+	placementLocations = []
+	for x in xRange:
+		for y in yRange:
+			# the location fits if every letter lands on an empty or matching cell
+			fits = True
+			for letterIndex in range(len(word)):
+				letterLocation = [x, y]
+				if(placementType == "horizontal" or placementType == "diagonal"):
+					letterLocation[0] += letterIndex
+				if(placementType == "vertical" or placementType == "diagonal"):
+					letterLocation[1] += letterIndex
+
+				if(grid[letterLocation[0]][letterLocation[1]] != "" and grid[letterLocation[0]][letterLocation[1]] != word[letterIndex]):
+					fits = False
+					break
+			if(fits):
+				placementLocations.append([x, y])
+
+	return placementLocations
+
 # convert word search grid to printable string
 def stringifyWordSearch(wordSearchArray):
 	returnValue = ""
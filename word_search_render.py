@@ -0,0 +1,431 @@
+"""Streams puzzles into printable multi-page DOCX or PDF workbooks.
+
+    python word_search_render.py puzzles.bwsa workbook.pdf --answer-key
+
+Each puzzle gets a page with its grid as a table and a word bank underneath, and
+optionally an answer-key page with the words highlighted. Pages are written out
+as they are rendered, so memory stays bounded however many puzzles go in. The
+per-dimension layout of a grid is built once and shared by every page of that
+size. Standard library only: DOCX is zipped WordprocessingML and PDF uses the
+built-in Courier and Helvetica fonts.
+"""
+
+import argparse
+import os
+import sys
+import zipfile
+import zlib
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from bigus_word_search import STEPS, Puzzle
+from word_search_archive import PuzzleArchive
+
+# US Letter with 3/4 inch margins, in PDF points and in DOCX twips (1/20 point)
+PAGE_WIDTH, PAGE_HEIGHT, MARGIN = 612, 792, 54
+TWIPS = 20
+BANK_COLUMNS = 3
+
+
+class DocxRenderer:
+    """Writes puzzles into a .docx file, use as a context manager. The document
+    body is streamed into the zip entry page by page."""
+
+    CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    RELATIONSHIPS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Type="http://schemas.'
+        "openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+        '" Target="word/document.xml"/></Relationships>'
+    )
+    DOCUMENT_START = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/'
+        '2006/main"><w:body>'
+    )
+    DOCUMENT_END = (
+        "<w:p/>"
+        f'<w:sectPr><w:pgSz w:w="{PAGE_WIDTH * TWIPS}" w:h="{PAGE_HEIGHT * TWIPS}"/>'
+        f'<w:pgMar w:top="{MARGIN * TWIPS}" w:right="{MARGIN * TWIPS}" '
+        f'w:bottom="{MARGIN * TWIPS}" w:left="{MARGIN * TWIPS}" w:header="0" '
+        'w:footer="0" w:gutter="0"/></w:sectPr></w:body></w:document>'
+    )
+    PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+    def __init__(self, path: str, title: str = "Word Search", answer_key=False):
+        self.path = path
+        self.title = title
+        self.answer_key = answer_key
+        self.count = 0
+        self.pages = 0
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", self.CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", self.RELATIONSHIPS)
+        self._body = self._zip.open("word/document.xml", "w", force_zip64=True)
+        self._body.write(self.DOCUMENT_START.encode("utf-8"))
+
+    @staticmethod
+    def heading(text: str) -> str:
+        return (
+            '<w:p><w:pPr><w:spacing w:after="240"/><w:jc w:val="center"/></w:pPr>'
+            f'<w:r><w:rPr><w:b/><w:sz w:val="36"/></w:rPr><w:t>{escape(text)}</w:t>'
+            "</w:r></w:p>"
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def grid_layout(dimension: int) -> tuple:
+        """Table prolog, row start and the three kinds of cell start for a grid
+        size: plain letter, highlighted word letter and greyed filler letter"""
+        width = (PAGE_WIDTH - 2 * MARGIN) * TWIPS
+        cell = min(width // dimension, 28 * TWIPS)
+        size = max(8, cell * 3 // 50)  # letter height in half points
+        prolog = (
+            '<w:tbl><w:tblPr><w:jc w:val="center"/><w:tblBorders><w:top '
+            'w:val="single" w:sz="8"/><w:left w:val="single" w:sz="8"/><w:bottom '
+            'w:val="single" w:sz="8"/><w:right w:val="single" w:sz="8"/>'
+            '</w:tblBorders><w:tblLayout w:type="fixed"/><w:tblCellMar><w:left w:w="0" '
+            'w:type="dxa"/><w:right w:w="0" w:type="dxa"/></w:tblCellMar>'
+            "</w:tblPr><w:tblGrid>"
+            + f'<w:gridCol w:w="{cell}"/>' * dimension
+            + "</w:tblGrid>"
+        )
+        row = f'<w:tr><w:trPr><w:trHeight w:val="{cell}" w:hRule="exact"/></w:trPr>'
+
+        def cell_start(shading: str, color: str) -> str:
+            return (
+                f'<w:tc><w:tcPr><w:tcW w:w="{cell}" w:type="dxa"/>{shading}'
+                '<w:vAlign w:val="center"/></w:tcPr><w:p><w:pPr><w:spacing '
+                'w:before="0" w:after="0"/><w:jc w:val="center"/></w:pPr><w:r>'
+                '<w:rPr><w:rFonts w:ascii="Courier New" w:hAnsi="Courier New"/><w:b/>'
+                f'{color}<w:sz w:val="{size}"/></w:rPr><w:t>'
+            )
+
+        return (
+            prolog,
+            row,
+            cell_start("", ""),
+            cell_start('<w:shd w:val="clear" w:color="auto" w:fill="FFE066"/>', ""),
+            cell_start("", '<w:color w:val="B0B0B0"/>'),
+        )
+
+    CELL_END = "</w:t></w:r></w:p></w:tc>"
+
+    def grid_table(self, puzzle: Puzzle, highlight: set = None) -> str:
+        prolog, row_start, plain, marked, filler = self.grid_layout(
+            puzzle.grid_dimension
+        )
+        texts = {
+            letter: escape(letter) + self.CELL_END
+            for letter in set("".join(puzzle.grid))
+        }
+        parts = [prolog]
+        for row, letters in enumerate(puzzle.grid):
+            parts.append(row_start)
+            for col, letter in enumerate(letters):
+                if highlight is None:
+                    parts.append(plain)
+                else:
+                    parts.append(marked if (row, col) in highlight else filler)
+                parts.append(texts[letter])
+            parts.append("</w:tr>")
+        parts.append("</w:tbl>")
+        return "".join(parts)
+
+    @staticmethod
+    def word_bank(words) -> str:
+        """Borderless table listing the words in BANK_COLUMNS columns"""
+        rows = -(-len(words) // BANK_COLUMNS)
+        width = (PAGE_WIDTH - 2 * MARGIN) * TWIPS // BANK_COLUMNS
+        parts = [
+            '<w:p><w:pPr><w:spacing w:before="240" w:after="0"/></w:pPr></w:p>'
+            '<w:tbl><w:tblPr><w:jc w:val="center"/></w:tblPr><w:tblGrid>'
+            + f'<w:gridCol w:w="{width}"/>' * BANK_COLUMNS
+            + "</w:tblGrid>"
+        ]
+        for row in range(rows):
+            parts.append("<w:tr>")
+            for col in range(BANK_COLUMNS):
+                idx = col * rows + row  # read down each column
+                word = escape(words[idx]) if idx < len(words) else ""
+                parts.append(
+                    f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/></w:tcPr>'
+                    '<w:p><w:pPr><w:spacing w:before="0" w:after="0"/></w:pPr>'
+                    f"<w:r><w:t>{word}</w:t></w:r></w:p></w:tc>"
+                )
+            parts.append("</w:tr>")
+        parts.append("</w:tbl>")
+        return "".join(parts)
+
+    def add(self, puzzle: Puzzle):
+        """Renders a puzzle page, and its answer-key page if enabled"""
+        self.count += 1
+        pages = [
+            self.heading(f"{self.title} {self.count}")
+            + self.grid_table(puzzle)
+            + self.word_bank(puzzle.words)
+        ]
+        if self.answer_key:
+            pages.append(
+                self.heading(f"{self.title} {self.count}: answer key")
+                + self.grid_table(puzzle, puzzle.word_cells())
+            )
+        for page in pages:
+            if self.pages:
+                self._body.write(self.PAGE_BREAK.encode("utf-8"))
+            self._body.write(page.encode("utf-8"))
+            self.pages += 1
+
+    def close(self):
+        if self._zip.fp is None:
+            return
+        self._body.write(self.DOCUMENT_END.encode("utf-8"))
+        self._body.close()
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def pdf_text(text: str) -> bytes:
+    """Encodes text as a PDF literal string in the fonts' WinAnsi encoding"""
+    encoded = text.encode("cp1252", errors="replace")
+    for special in (b"\\", b"(", b")"):
+        encoded = encoded.replace(special, b"\\" + special)
+    return b"(" + encoded + b")"
+
+
+class PdfRenderer:
+    """Writes puzzles into a .pdf file, use as a context manager. Each page is
+    written as soon as it is rendered; only the page object numbers are kept."""
+
+    # object numbers fixed up front: catalog, page tree, fonts, shared resources
+    CATALOG, PAGES, RESOURCES = 1, 2, 6
+    FONTS = ((3, "Helvetica"), (4, "Helvetica-Bold"), (5, "Courier-Bold"))
+    LINE_HEIGHT = 13
+    BANK_SIZE = 10
+
+    def __init__(self, path: str, title: str = "Word Search", answer_key=False):
+        self.path = path
+        self.title = title
+        self.answer_key = answer_key
+        self.count = 0
+        self.offsets = {}  # object number -> byte offset
+        self.page_ids = []
+        self._next_id = self.RESOURCES + 1
+        self._file = open(path, "wb")
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+        self.write_object(self.CATALOG, f"<< /Type /Catalog /Pages {self.PAGES} 0 R >>")
+        for number, font in self.FONTS:
+            self.write_object(
+                number,
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} "
+                "/Encoding /WinAnsiEncoding >>",
+            )
+        fonts = " ".join(
+            f"/F{idx} {number} 0 R" for idx, (number, _) in enumerate(self.FONTS, 1)
+        )
+        self.write_object(self.RESOURCES, f"<< /Font << {fonts} >> >>")
+
+    def write_object(self, number: int, body, stream: bytes = None):
+        self.offsets[number] = self._file.tell()
+        if isinstance(body, str):
+            body = body.encode("latin-1")
+        self._file.write(f"{number} 0 obj\n".encode("latin-1") + body)
+        if stream is not None:
+            self._file.write(b"\nstream\n" + stream + b"\nendstream")
+        self._file.write(b"\nendobj\n")
+
+    def write_page(self, content: bytes):
+        """Writes one page with its compressed content stream"""
+        content_id, page_id = self._next_id, self._next_id + 1
+        self._next_id += 2
+        stream = zlib.compress(content)
+        self.write_object(
+            content_id,
+            f"<< /Length {len(stream)} /Filter /FlateDecode >>",
+            stream,
+        )
+        self.write_object(
+            page_id,
+            f"<< /Type /Page /Parent {self.PAGES} 0 R "
+            f"/MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources {self.RESOURCES} 0 R /Contents {content_id} 0 R >>",
+        )
+        self.page_ids.append(page_id)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def grid_layout(dimension: int) -> tuple:
+        """(cell size, font size, grid left, grid top, per-cell text positioning
+        operators) for a grid size; a page only adds the letters"""
+        width = PAGE_WIDTH - 2 * MARGIN
+        cell = min(width / dimension, 28)
+        size = cell * 0.6
+        left = (PAGE_WIDTH - cell * dimension) / 2
+        top = PAGE_HEIGHT - MARGIN - 40
+        # Courier letters are 0.6 em wide; baseline about a third of the way up
+        positions = tuple(
+            f"1 0 0 1 {left + (col + 0.5) * cell - 0.3 * size:.2f} "
+            f"{top - (row + 0.65) * cell:.2f} Tm ".encode("latin-1")
+            for row in range(dimension)
+            for col in range(dimension)
+        )
+        return cell, size, left, top, positions
+
+    def heading(self, text: str) -> bytes:
+        return (
+            b"BT /F2 18 Tf 1 0 0 1 %.2f %.2f Tm " % (MARGIN, PAGE_HEIGHT - MARGIN - 18)
+            + pdf_text(text)
+            + b" Tj ET\n"
+        )
+
+    def grid_content(self, puzzle: Puzzle, highlight: set = None) -> bytes:
+        cell, size, left, top, positions = self.grid_layout(puzzle.grid_dimension)
+        span = cell * puzzle.grid_dimension
+        parts = [b"0.5 w %.2f %.2f %.2f %.2f re S\n" % (left, top - span, span, span)]
+
+        if highlight is not None:  # a rounded marker stroke under each word
+            parts.append(b"1 0.88 0.4 RG %.2f w 1 J\n" % (cell * 0.8))
+            for word, orientation, (row, col) in puzzle.placements:
+                row_step, col_step = STEPS[orientation]
+                end_row = row + row_step * (len(word) - 1)
+                end_col = col + col_step * (len(word) - 1)
+                parts.append(
+                    b"%.2f %.2f m %.2f %.2f l S\n"
+                    % (
+                        left + (col + 0.5) * cell,
+                        top - (row + 0.5) * cell,
+                        left + (end_col + 0.5) * cell,
+                        top - (end_row + 0.5) * cell,
+                    )
+                )
+
+        parts.append(b"BT /F3 %.2f Tf\n" % size)
+        letters = "".join(puzzle.grid)
+        shows = {letter: pdf_text(letter) + b" Tj\n" for letter in set(letters)}
+        if highlight is None:
+            parts.extend(map(bytes.__add__, positions, map(shows.get, letters)))
+        else:
+            dimension = puzzle.grid_dimension
+            for pos, (position, letter) in enumerate(zip(positions, letters)):
+                shade = b"0 g " if divmod(pos, dimension) in highlight else b"0.7 g "
+                parts.append(shade + position + shows[letter])
+        parts.append(b"ET\n")
+        return b"".join(parts)
+
+    def bank_pages(self, words, first_top: float) -> list:
+        """Word bank text per page: the rest of the grid page, then continuation
+        pages, in BANK_COLUMNS columns read top to bottom"""
+        column_width = (PAGE_WIDTH - 2 * MARGIN) / BANK_COLUMNS
+        pages = []
+        top, remaining = first_top, list(words)
+        while remaining:
+            rows = max(1, int((top - MARGIN) // self.LINE_HEIGHT))
+            chunk = remaining[: rows * BANK_COLUMNS]
+            remaining = remaining[len(chunk) :]
+            rows = -(-len(chunk) // BANK_COLUMNS)
+            parts = [b"BT /F1 %d Tf\n" % self.BANK_SIZE]
+            for idx, word in enumerate(chunk):
+                col, row = divmod(idx, rows)
+                parts.append(
+                    b"1 0 0 1 %.2f %.2f Tm "
+                    % (MARGIN + col * column_width, top - row * self.LINE_HEIGHT)
+                    + pdf_text(word)
+                    + b" Tj\n"
+                )
+            parts.append(b"ET\n")
+            pages.append(b"".join(parts))
+            top = PAGE_HEIGHT - MARGIN - 40
+        return pages
+
+    def add(self, puzzle: Puzzle):
+        """Renders a puzzle page, any word bank overflow pages and, if enabled,
+        an answer-key page"""
+        self.count += 1
+        heading = f"{self.title} {self.count}"
+        cell, _, _, top, _ = self.grid_layout(puzzle.grid_dimension)
+        bank_top = top - cell * puzzle.grid_dimension - 24
+        banks = self.bank_pages(puzzle.words, bank_top) or [b""]
+
+        self.write_page(self.heading(heading) + self.grid_content(puzzle) + banks[0])
+        for bank in banks[1:]:
+            self.write_page(self.heading(f"{heading} (continued)") + bank)
+        if self.answer_key:
+            self.write_page(
+                self.heading(f"{heading}: answer key")
+                + self.grid_content(puzzle, puzzle.word_cells())
+            )
+
+    def close(self):
+        if self._file.closed:
+            return
+        kids = " ".join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self.write_object(
+            self.PAGES,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>",
+        )
+
+        xref_offset = self._file.tell()
+        size = self._next_id
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        lines.extend(
+            f"{self.offsets[number]:010d} 00000 n \n" for number in range(1, size)
+        )
+        lines.append(f"trailer\n<< /Size {size} /Root {self.CATALOG} 0 R >>\n")
+        lines.append(f"startxref\n{xref_offset}\n%%EOF\n")
+        self._file.write("".join(lines).encode("latin-1"))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+RENDERERS = {".docx": DocxRenderer, ".pdf": PdfRenderer}
+
+
+def render_puzzles(puzzles, path: str, title: str = "Word Search", answer_key=False):
+    """Streams an iterable of puzzles into a DOCX or PDF file picked by its suffix,
+    returns how many were rendered"""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix not in RENDERERS:
+        raise ValueError(f"Unknown document type '{suffix}', expected .docx or .pdf")
+    with RENDERERS[suffix](path, title, answer_key) as renderer:
+        for puzzle in puzzles:
+            renderer.add(puzzle)
+        return renderer.count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("archive", help="puzzle archive from word_search_archive")
+    parser.add_argument("output", help="workbook path ending in .docx or .pdf")
+    parser.add_argument("--title", default="Word Search")
+    parser.add_argument("--answer-key", action="store_true")
+    args = parser.parse_args(argv)
+
+    with PuzzleArchive(args.archive) as archive:
+        count = render_puzzles(archive, args.output, args.title, args.answer_key)
+    print(f"Rendered {count} puzzles to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
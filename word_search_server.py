@@ -0,0 +1,315 @@
+"""Local asyncio HTTP service that generates word searches in a process pool.
+
+    python word_search_server.py --port 8765
+
+POST /generate takes a JSON body such as
+
+    {"words": ["LAS VEGAS", "RENO"], "seed": 7, "options": {"fill": "unique"}}
+
+and answers with Puzzle.to_dict(). Identical requests in flight at the same time
+share one job, and once max_pending distinct jobs are queued new ones get a 503
+with Retry-After. The word list and numeric options are bounded, see
+OPTION_BOUNDS, and a job running past JOB_TIME_LIMIT seconds is stopped with a
+422. GET /health reports the pool state. Standard library only.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import random
+import signal
+from concurrent.futures import ProcessPoolExecutor
+
+from bigus_word_search import PlacementError, generate
+from word_search_cache import cache_key
+
+logger = logging.getLogger(__name__)
+
+# CreateWordSearch options a client may set; file output and hooks stay server side
+ALLOWED_OPTIONS = (
+    "engine",
+    "solver",
+    "time_budget",
+    "step_budget",
+    "max_backtrack",
+    "grid_dimension",
+    "sizing",
+    "rev_percent",
+    "fill",
+    "directions",
+)
+JOB_TIME_LIMIT = 60  # seconds of wall clock a worker spends on one job
+# (lowest, highest) value of the numeric options; the budgets also default to
+# their highest rather than to no limit
+OPTION_BOUNDS = {
+    "time_budget": (0, JOB_TIME_LIMIT),
+    "step_budget": (1, 1_000_000),
+    "max_backtrack": (0, 100),
+    "grid_dimension": (2, 256),
+    "rev_percent": (0, 100),
+}
+BUDGETS = ("time_budget", "step_budget")
+MAX_WORDS = 1000
+MAX_WORD_LENGTH = 100
+MAX_LETTERS = 10_000  # over all the words of a puzzle
+MAX_BODY_BYTES = 1 << 20
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class RequestError(Exception):
+    """A request the server answers with an error status instead of a puzzle"""
+
+    def __init__(self, status: int, message: str, **details):
+        super().__init__(message)
+        self.status = status
+        self.body = {"error": message, **details}
+
+
+class JobTimeout(Exception):
+    """Raised in a worker whose job has run for JOB_TIME_LIMIT seconds"""
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout()
+
+
+def _generate_job(words: list, seed: int, options: dict) -> dict:
+    """Process pool worker, PlacementError is returned as data so it pickles simply.
+    Where SIGALRM exists, a job is stopped after JOB_TIME_LIMIT seconds."""
+    timed = hasattr(signal, "setitimer")
+    if timed:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, JOB_TIME_LIMIT)
+    try:
+        return generate(words, seed=seed, **options).to_dict()
+    except PlacementError as error:
+        return {"error": str(error), "reason": error.reason, "word": error.word}
+    except JobTimeout:
+        return {
+            "error": f"Generation took longer than {JOB_TIME_LIMIT}s",
+            "reason": "time_limit",
+            "word": None,
+        }
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class GenerationServer:
+    """Accepts generation requests over HTTP and runs them in a bounded pool"""
+
+    def __init__(self, workers: int = None, max_pending: int = 64):
+        # workers are started lazily, while a client socket may be open; forked
+        # ones would inherit it and hold the connection open after it is closed
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(start_method)
+        )
+        self.max_pending = max_pending
+        self.in_flight = {}  # cache key -> future shared by identical requests
+        self.coalesced = 0
+
+    def parse_job(self, body: bytes) -> tuple:
+        """Validates a /generate body and returns (words, seed, options)"""
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError as error:
+            raise RequestError(400, f"Invalid JSON: {error}")
+        if not isinstance(request, dict):
+            raise RequestError(400, "Expected a JSON object")
+
+        words = request.get("words")
+        if (
+            not isinstance(words, list)
+            or not words
+            or not all(isinstance(word, str) and word.strip() for word in words)
+        ):
+            raise RequestError(400, "'words' must be a non-empty list of strings")
+        if len(words) > MAX_WORDS:
+            raise RequestError(400, f"At most {MAX_WORDS} words per puzzle")
+        if any(len(word) > MAX_WORD_LENGTH for word in words):
+            raise RequestError(400, f"Words are at most {MAX_WORD_LENGTH} letters")
+        if sum(len(word) for word in words) > MAX_LETTERS:
+            raise RequestError(400, f"At most {MAX_LETTERS} letters per puzzle")
+
+        seed = request.get("seed")
+        if seed is None:  # unseeded requests are all different puzzles
+            seed = random.getrandbits(63)
+        elif not isinstance(seed, int):
+            raise RequestError(400, "'seed' must be an integer")
+
+        options = request.get("options", {})
+        if not isinstance(options, dict):
+            raise RequestError(400, "'options' must be an object")
+        unknown = sorted(set(options) - set(ALLOWED_OPTIONS))
+        if unknown:
+            raise RequestError(400, f"Unsupported options: {', '.join(unknown)}")
+        # the budgets only bind the backtracking solver, as in the CLI
+        options = {"solver": "backtrack", **options}
+        for name, (lowest, highest) in OPTION_BOUNDS.items():
+            value = options.get(name)
+            if value is None and name in BUDGETS:
+                options[name] = value = highest
+            if value is None:  # left to CreateWordSearch, e.g. sizing the grid
+                continue
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or not lowest <= value <= highest
+            ):
+                raise RequestError(
+                    400, f"'{name}' must be a number from {lowest} to {highest}"
+                )
+
+        return words, seed, options
+
+    async def submit(self, words: list, seed: int, options: dict) -> dict:
+        """Runs a job in the pool, sharing it with identical requests in flight"""
+        key = cache_key(words, seed, options)
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        if len(self.in_flight) >= self.max_pending:
+            raise RequestError(503, "Generation queue is full, retry later")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.pool, _generate_job, words, seed, options)
+        self.in_flight[key] = future
+        future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def respond(self, method: str, path: str, body: bytes) -> tuple:
+        """Routes one request and returns (status, JSON-ready body)"""
+        if path == "/health":
+            return 200, {
+                "pending": len(self.in_flight),
+                "max_pending": self.max_pending,
+                "coalesced": self.coalesced,
+            }
+        if path != "/generate":
+            raise RequestError(404, f"No route for {path}")
+        if method != "POST":
+            raise RequestError(405, "Use POST for /generate")
+
+        job = self.parse_job(body)
+        try:
+            result = await self.submit(*job)
+        except RequestError:
+            raise
+        except (TypeError, ValueError) as error:  # rejected by CreateWordSearch
+            raise RequestError(400, str(error))
+        except Exception as error:  # e.g. MemoryError or a broken pool
+            logger.exception("Generation failed")
+            raise RequestError(500, f"Generation failed: {error!r}")
+        if "error" in result:
+            raise RequestError(422, result["error"], **result)
+        return 200, result
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves HTTP/1.1 requests on one connection until it closes"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode("latin-1").split(None, 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (
+                    version.strip() == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                length = int(headers.get("content-length", 0))
+                extra_headers = {}
+                if length > MAX_BODY_BYTES:
+                    status, payload = 413, {"error": "Request body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length)
+                    try:
+                        status, payload = await self.respond(method, path, body)
+                    except RequestError as error:
+                        status, payload = error.status, error.body
+                        if status == 503:
+                            extra_headers["Retry-After"] = "1"
+
+                self.write_response(writer, status, payload, keep_alive, extra_headers)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def write_response(
+        writer, status: int, payload: dict, keep_alive: bool, extra_headers: dict
+    ):
+        body = json.dumps(payload).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **extra_headers,
+        }
+        head = f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765):
+        server = await asyncio.start_server(self.handle, host, port)
+        logger.info(f"Serving word searches on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="pool size, defaults to CPUs")
+    parser.add_argument("--max-pending", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        format="%(asctime)s : %(levelname)s : %(message)s", level=logging.WARNING
+    )
+    logger.setLevel(logging.INFO)  # per-puzzle generation details stay quiet
+    server = GenerationServer(args.workers, args.max_pending)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
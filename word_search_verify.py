@@ -0,0 +1,130 @@
+"""Finds every occurrence of the search words in a finished grid.
+
+One Aho-Corasick automaton holds each word and its reverse, so a single scan of
+every row, column, diagonal and anti-diagonal finds the words read in all eight
+directions. Build a WordFinder once per word list and reuse it across puzzles.
+"""
+
+from collections import deque
+
+# (row step, col step) of the lines scanned; reversed words cover the other four
+LINE_STEPS = ((0, 1), (1, 0), (1, 1), (-1, 1))
+
+
+def grid_lines(rows: int, cols: int):
+    """Yields (step, cells) for every row, column, diagonal and anti-diagonal"""
+    for row in range(rows):
+        yield (0, 1), [(row, col) for col in range(cols)]
+    for col in range(cols):
+        yield (1, 0), [(row, col) for row in range(rows)]
+
+    for step in ((1, 1), (-1, 1)):
+        row_step, col_step = step
+        # a line starts on the first column, or on the edge row it runs away from
+        edge_row = 0 if row_step == 1 else rows - 1
+        starts = [(row, 0) for row in range(rows)]
+        starts += [(edge_row, col) for col in range(1, cols)]
+        for row, col in starts:
+            cells = []
+            while 0 <= row < rows and 0 <= col < cols:
+                cells.append((row, col))
+                row += row_step
+                col += col_step
+            yield step, cells
+
+
+class WordFinder:
+    """Multi-pattern automaton over a word list and the reverse of each word"""
+
+    def __init__(self, words):
+        self.words = []  # search words as they appear on the grid
+        for word in words:
+            letters = word.replace(" ", "").upper()
+            if letters and letters not in self.words:
+                self.words.append(letters)
+
+        self.goto = [{}]  # state -> {letter: next state}
+        self.fail = [0]
+        self.output = [[]]  # state -> [(word index, reversed)] ending here
+        for idx, word in enumerate(self.words):
+            self._add(word, (idx, False))
+            if word != word[::-1]:  # palindromes would otherwise match twice
+                self._add(word[::-1], (idx, True))
+        self._link()
+
+    def _add(self, pattern: str, match: tuple):
+        state = 0
+        for letter in pattern:
+            following = self.goto[state].get(letter)
+            if following is None:
+                following = len(self.goto)
+                self.goto[state][letter] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = following
+        self.output[state].append(match)
+
+    def _link(self):
+        """Breadth first pass setting failure links and merging their outputs"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for letter, following in self.goto[state].items():
+                queue.append(following)
+                fallback = self.fail[state]
+                while fallback and letter not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[following] = self.goto[fallback].get(letter, 0)
+                self.output[following] = (
+                    self.output[following] + self.output[self.fail[following]]
+                )
+
+    def find(self, grid) -> list:
+        """Returns every occurrence as (word, (row, col), (row step, col step)),
+        starting at the word's first letter and stepping in its reading direction"""
+        rows = [str(row) if isinstance(row, str) else "".join(row) for row in grid]
+        rows = [row.upper() for row in rows]
+        goto, fail, output = self.goto, self.fail, self.output
+
+        occurrences = []
+        for (row_step, col_step), cells in grid_lines(len(rows), len(rows[0])):
+            state = 0
+            for pos, (row, col) in enumerate(cells):
+                letter = rows[row][col]
+                while state and letter not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(letter, 0)
+
+                for idx, is_reversed in output[state]:
+                    word = self.words[idx]
+                    if is_reversed:  # read from this cell back along the line
+                        occurrences.append((word, (row, col), (-row_step, -col_step)))
+                    else:
+                        occurrences.append(
+                            (word, cells[pos - len(word) + 1], (row_step, col_step))
+                        )
+
+        return occurrences
+
+    def verify(self, grid) -> dict:
+        """Counts occurrences per word. A valid puzzle has every word exactly once;
+        missing lists words not found and duplicates maps words found more often."""
+        counts = dict.fromkeys(self.words, 0)
+        for word, _, _ in self.find(grid):
+            counts[word] += 1
+
+        return {
+            "missing": [word for word, count in counts.items() if count == 0],
+            "duplicates": {word: count for word, count in counts.items() if count > 1},
+        }
+
+
+def find_occurrences(grid, words) -> list:
+    """One-off convenience wrapper around WordFinder(words).find(grid)"""
+    return WordFinder(words).find(grid)
+
+
+def verify_puzzle(puzzle) -> dict:
+    """Verifies a bigus_word_search.Puzzle against its own word list"""
+    return WordFinder(puzzle.words).verify(puzzle.grid)